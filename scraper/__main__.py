@@ -0,0 +1,243 @@
+"""
+Command line entry point for every registered country scraper
+
+Usage (from the repository root):
+    python -m scraper list
+    python -m scraper run                              # every country
+    python -m scraper run --countries gh,ng,ke --jobs 3
+    python -m scraper near-dups                        # similar codes across countries
+    python -m scraper collisions --countries gh -v     # codes claimed by several providers
+    python -m scraper dial '*920*3'                    # known codes starting with a prefix
+    python -m scraper run --countries gh --queue q.db  # queue pages for workers, collect results
+    python -m scraper work --queue q.db --processes 4  # scrape queued pages
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import code_prefix
+from base_scraper import (COUNTRY_REGISTRY, DATASET_DIR, DEFAULT_EXPORTS, EXPORT_STAGES, available_countries,
+                          configure_stdout, get_scraper_class)
+from code_index import CodeIndex
+from near_dup import find_near_duplicates
+from runner import print_summary, run_countries, run_workers
+from work_queue import open_queue
+
+
+def selected_countries(args):
+    """--countries as a list of names (every registered country by default)"""
+    if args.countries in (None, 'all'):
+        return available_countries()
+    return [country.strip() for country in args.countries.split(',') if country.strip()]
+
+
+def list_countries(args):
+    print("🌍 Available countries:")
+    for code in available_countries():
+        cls = COUNTRY_REGISTRY[code]
+        print(f"  {code}  {cls.country_name:<14} ussd_codes_{cls.slug}.json")
+    return 0
+
+
+def run(args):
+    countries = [get_scraper_class(country).country_code for country in selected_countries(args)]
+
+    options = {'concurrent': True}
+    if args.no_cache:
+        options['cache_dir'] = None
+    if args.incremental:
+        options['incremental'] = True
+    if args.stream:
+        options['stream'] = True
+    if args.no_fuzzy_dedup:
+        options['fuzzy_dedup'] = False
+    if args.resume:
+        options['resume'] = True
+    if args.queue:
+        options['work_queue'] = args.queue
+    if args.queue_timeout is not None:
+        options['queue_timeout'] = args.queue_timeout
+    if args.retries is not None:
+        options['retries'] = args.retries
+    if args.skip_exports or args.exports:
+        skipped = {stage.strip() for stage in (args.skip_exports or '').split(',')}
+        added = {stage.strip() for stage in (args.exports or '').split(',')}
+        unknown = (skipped | added) - set(EXPORT_STAGES) - {''}
+        if unknown:
+            raise KeyError(f"Unknown export stages: {', '.join(sorted(unknown))}")
+        options['exports'] = [stage for stage in EXPORT_STAGES
+                              if (stage in DEFAULT_EXPORTS or stage in added) and stage not in skipped]
+
+    print(f"🚀 Running {len(countries)} countries: {', '.join(countries)}")
+    start = time.perf_counter()
+    results = run_countries(countries, jobs=args.jobs, output_dir=args.output_dir, options=options)
+    wall_seconds = time.perf_counter() - start
+
+    for result in results:
+        if args.verbose or result.error:
+            print(f"\n----- {result.country_name} -----")
+            print(result.log.rstrip())
+
+    print()
+    print_summary(results, wall_seconds)
+    return 1 if any(result.error for result in results) else 0
+
+
+def work(args):
+    options = {'cache_dir': None} if args.no_cache else {}
+    print(f"👷 {args.processes} worker(s) on {args.queue}")
+    start = time.perf_counter()
+    completed = run_workers(args.queue, processes=args.processes, batch_size=args.batch_size,
+                            idle_exit=args.idle_exit, options=options)
+    queue = open_queue(args.queue)
+    counts = queue.counts()
+    queue.close()
+    print(f"✅ {completed} pages in {time.perf_counter() - start:.1f}s; queue: "
+          + ', '.join(f'{count} {state}' for state, count in counts.items()))
+    return 0
+
+
+def near_duplicates(args):
+    records = []
+    for path in sorted(glob.glob(os.path.join(args.dataset_dir, 'ussd_codes_*.json'))):
+        with open(path, encoding='utf-8') as f:
+            records.extend(json.load(f))
+
+    pairs = find_near_duplicates(records, args.threshold)
+    print(f"🧬 {len(pairs)} near-duplicate pairs among {len(records)} codes (similarity >= {args.threshold})")
+    for pair in pairs[:args.limit]:
+        first, second = pair.first, pair.second
+        print(f"  {pair.similarity:.2f}  {first['country']} {first['code']} {first['name']!r} ({first['provider']})"
+              f"  ~  {second['country']} {second['code']} {second['name']!r} ({second['provider']})")
+    return 0
+
+
+def collisions(args):
+    for country in selected_countries(args):
+        cls = get_scraper_class(country)
+        path = os.path.join(args.dataset_dir, f'ussd_codes_{cls.slug}.json')
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding='utf-8') as f:
+            index = CodeIndex(json.load(f), cls.country_name)
+
+        conflicts = index.conflicts()
+        print(f"\n🔀 {cls.country_name}: {len(conflicts)} conflicting codes, "
+              f"{len(index.network_scoped())} network-scoped, {len(index.shared_prefixes())} shared prefixes")
+        for collision in conflicts:
+            print(f"  ❗ {collision.code}: {', '.join(collision.providers)}")
+        if args.verbose:
+            for collision in index.network_scoped():
+                print(f"  📶 {collision.code}: {', '.join(collision.providers)}")
+            for (_, prefix), codes in index.shared_prefixes().items():
+                print(f"  🌳 {prefix}: {', '.join(codes)}")
+    return 0
+
+
+def dial(args):
+    for country in selected_countries(args):
+        cls = get_scraper_class(country)
+        path = os.path.join(args.dataset_dir, code_prefix.PREFIX_DIR_NAME, f'ussd_codes_{cls.slug}.prefix.json')
+        if not os.path.exists(path):
+            continue
+        index = code_prefix.load(path)
+        matches = index.codes_with_prefix(args.dialed)
+        if matches:
+            print(f"📟 {cls.country_name}: {', '.join(matches[:args.limit])}"
+                  + (f" (+{len(matches) - args.limit} more)" if len(matches) > args.limit else ''))
+        elif args.verbose:
+            known = index.longest_known_prefix(args.dialed)
+            print(f"📟 {cls.country_name}: no codes start with {args.dialed} (longest known prefix {known or '-'})")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m scraper', description='USSD code scrapers')
+    commands = parser.add_subparsers(dest='command')
+
+    list_parser = commands.add_parser('list', help='list registered countries')
+    list_parser.set_defaults(handler=list_countries)
+
+    run_parser = commands.add_parser('run', help='scrape countries and write their datasets')
+    run_parser.add_argument('--countries', help="comma-separated codes or names, e.g. gh,ng,ke (default: all)")
+    run_parser.add_argument('--jobs', '-j', type=int, default=None,
+                            help='worker processes (default: one per country, up to the CPU count)')
+    run_parser.add_argument('--output-dir', default=DATASET_DIR, help='where ussd_codes_*.json are written')
+    run_parser.add_argument('--no-cache', action='store_true', help='skip the on-disk HTTP cache')
+    run_parser.add_argument('--incremental', action='store_true',
+                            help='reuse records of sources unchanged since the last run')
+    run_parser.add_argument('--stream', action='store_true',
+                            help='spool raw records to NDJSON while scraping (bounded memory on large crawls)')
+    run_parser.add_argument('--no-fuzzy-dedup', action='store_true',
+                            help='only drop exact (code, provider) duplicates')
+    resume_or_queue = run_parser.add_mutually_exclusive_group()
+    resume_or_queue.add_argument('--resume', action='store_true',
+                                 help="continue an interrupted run from its checkpoint instead of starting over")
+    run_parser.add_argument('--retries', type=int, default=None,
+                            help='retries of a failed page fetch, with exponential backoff (default: 2)')
+    resume_or_queue.add_argument('--queue', metavar='LOCATION',
+                                 help="have 'work' processes scrape the pages through this queue (a SQLite file "
+                                      "path); every run scrapes its pages again, so it cannot be combined with --resume")
+    run_parser.add_argument('--queue-timeout', type=float, default=None, metavar='SECONDS',
+                            help='with --queue, fail when no queued page has finished for this long (default: 600)')
+    run_parser.add_argument('--skip-exports', metavar='STAGES',
+                            help=f"comma-separated export stages to skip ({', '.join(DEFAULT_EXPORTS)})")
+    run_parser.add_argument('--exports', metavar='STAGES',
+                            help="comma-separated opt-in export stages to run as well (ussdb)")
+    run_parser.add_argument('--verbose', '-v', action='store_true', help="print each country's progress log")
+    run_parser.set_defaults(handler=run)
+
+    work_parser = commands.add_parser('work', help="scrape pages queued by 'run --queue'")
+    work_parser.add_argument('--queue', metavar='LOCATION', required=True, help='the queue given to run --queue')
+    work_parser.add_argument('--processes', '-p', type=int, default=1, help='worker processes on this machine')
+    work_parser.add_argument('--batch-size', type=int, default=8, help='pages leased (and fetched concurrently) at a time')
+    work_parser.add_argument('--idle-exit', type=float, default=30.0,
+                             help='stop after the queue has been empty this many seconds')
+    work_parser.add_argument('--no-cache', action='store_true', help='skip the on-disk HTTP cache')
+    work_parser.set_defaults(handler=work)
+
+    collisions_parser = commands.add_parser('collisions', help='report codes claimed by several providers')
+    collisions_parser.add_argument('--countries', help="comma-separated codes or names (default: all)")
+    collisions_parser.add_argument('--dataset-dir', default=DATASET_DIR, help='where ussd_codes_*.json are read from')
+    collisions_parser.add_argument('--verbose', '-v', action='store_true',
+                                   help='also list network-scoped duplicates and shared prefixes')
+    collisions_parser.set_defaults(handler=collisions)
+
+    dial_parser = commands.add_parser('dial', help='known codes starting with a dialed prefix')
+    dial_parser.add_argument('dialed', help="what has been dialed so far, e.g. '*920*3'")
+    dial_parser.add_argument('--countries', help="comma-separated codes or names (default: all)")
+    dial_parser.add_argument('--dataset-dir', default=DATASET_DIR,
+                             help='dataset directory holding prefix/ussd_codes_*.prefix.json')
+    dial_parser.add_argument('--limit', type=int, default=10, help='codes to print per country')
+    dial_parser.add_argument('--verbose', '-v', action='store_true', help='also show countries without matches')
+    dial_parser.set_defaults(handler=dial)
+
+    dups_parser = commands.add_parser('near-dups', help='report near-duplicate codes across all countries')
+    dups_parser.add_argument('--dataset-dir', default=DATASET_DIR, help='where ussd_codes_*.json are read from')
+    dups_parser.add_argument('--threshold', type=float, default=0.7, help='minimum text similarity (0-1)')
+    dups_parser.add_argument('--limit', type=int, default=50, help='pairs to print')
+    dups_parser.set_defaults(handler=near_duplicates)
+
+    return parser
+
+
+def main(argv=None):
+    configure_stdout()
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not getattr(args, 'handler', None):
+        args = parser.parse_args(['list'])
+    try:
+        return args.handler(args)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
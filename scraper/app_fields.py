@@ -0,0 +1,51 @@
+"""
+Record fields as the app displays them
+Mirrors the derivations in lib/utils/ussd_data_service.dart, so artifacts built here (search
+index, sectioned export) match what USSDDataService shows and searches
+"""
+
+from typing import Dict
+
+# category.toLowerCase() -> (USSDCode.category, icon, color, description), as in
+# _mapCategoryName / _getCategoryIcon / _getCategoryColor / _getCategoryDescription
+CATEGORY_INFO = {
+    'banking': ('banking', '🏦', '#FFC700', 'Bank account and financial services'),
+    'telecom': ('telecom', '📱', '#0A3D91', 'Mobile network services and data bundles'),
+    'telecommunications': ('telecom', '📱', '#0A3D91', 'Mobile network services and data bundles'),
+    'utilities': ('utilities', '⚡', '#28A745', 'Electricity, water, and other utility services'),
+    'mobile money': ('mobile_money', '💰', '#6F42C1', 'Mobile money and digital payment services'),
+    'mobilemoney': ('mobile_money', '💰', '#6F42C1', 'Mobile money and digital payment services'),
+    'device info': ('device_info', '📲', '#17A2B8', 'Device information and diagnostic codes'),
+    'call management': ('call_management', '📞', '#E83E8C', 'Call forwarding, waiting, and caller ID'),
+    'account management': ('account_management', '👤', '#FD7E14', 'Check balance, usage, and refill account'),
+    'customer service': ('customer_service', '🎧', '#20C997', 'Customer support and service contacts'),
+    'transport': ('transport', '🚗', '#F012BE', 'Ride hailing and transport services'),
+}
+OTHER_CATEGORY = ('other', '📋', '#6C757D', 'Other services')
+
+
+def app_field(record: Dict, field: str, default: str = '') -> str:
+    """``record[field] ?? default`` as Dart reads it: only a missing or null value falls back"""
+    value = record.get(field)
+    return default if value is None else str(value)
+
+
+def display_name(record: Dict) -> str:
+    return app_field(record, 'name', 'Unknown')
+
+
+def display_provider(record: Dict) -> str:
+    """USSDCode.provider: the network (else provider) name without 'Ghana'"""
+    name = record.get('network')
+    if name is None:
+        name = app_field(record, 'provider', 'Unknown')
+    return str(name).replace(' Ghana', '').replace('Ghana', '').strip()
+
+
+def display_category(record: Dict) -> str:
+    return app_field(record, 'category', 'Other')
+
+
+def category_info(category: str) -> tuple:
+    """(mapped category, icon, color, description) for a dataset category name"""
+    return CATEGORY_INFO.get(category.lower(), OTHER_CATEGORY)
@@ -0,0 +1,794 @@
+"""
+Shared USSD scraper framework
+BaseUSSDScraper owns the fetch/parse/dedup/serialize pipeline used by every country;
+country modules subclass it and register with @register_country so a single entry point
+can enumerate and run them
+"""
+
+import glob
+import importlib
+import json
+import os
+import re
+import sys
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+import code_prefix
+import compact_format
+import search_index
+import sectioned_export
+from catalog import available_catalogs, load_catalog, load_catalog_file
+from checkpoint import CheckpointStore
+from code_context import CodeContextIndex
+from code_index import CodeIndex
+from crawler import Crawler, site_links
+from delta import DeltaExporter
+from discovery import SitemapDiscovery
+from fileio import write_if_changed
+from fetch_engine import ConcurrentFetcher
+from html_text import DEFAULT_BACKEND, extract_visible_text
+from incremental import FingerprintStore, fingerprint
+from near_dup import merge_near_duplicates
+from precompress import COMPRESSED_DIR_NAME, precompress
+from provider_match import PROVIDER_REGISTRY, get_provider_matcher
+from record_ids import assign_stable_ids
+from spool import RecordSpool, write_ndjson
+from work_queue import DONE, FAILED, WorkQueue, open_queue
+
+SCRAPER_DIR = os.path.dirname(os.path.abspath(__file__))
+DATASET_DIR = os.path.normpath(os.path.join(SCRAPER_DIR, '..', 'assets', 'dataset'))
+DEFAULT_CACHE_DIR = os.path.join(SCRAPER_DIR, '.http_cache')
+STATE_DIR = os.path.join(SCRAPER_DIR, '.scrape_state')
+LAST_UPDATED = '2025-10-18T00:00:00Z'
+
+# Artifacts derived from every saved dataset, in the order they are written
+EXPORT_STAGES = ('patches', 'ussdb', 'search', 'sections', 'prefix', 'compressed')
+# ussdb is opt-in: it does not decode faster than the JSON yet
+DEFAULT_EXPORTS = tuple(stage for stage in EXPORT_STAGES if stage != 'ussdb')
+
+# Pattern to match USSD codes (format: *123# or *123*1#)
+USSD_CODE_PATTERN = re.compile(r'\*\d{2,5}(?:\*\d+)*#')
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+}
+
+# Country code (also the record ID prefix) -> scraper class
+COUNTRY_REGISTRY: Dict[str, Type['BaseUSSDScraper']] = {}
+
+
+def register_country(cls: Type['BaseUSSDScraper']) -> Type['BaseUSSDScraper']:
+    """Class decorator adding a country scraper to COUNTRY_REGISTRY"""
+    COUNTRY_REGISTRY[cls.country_code] = cls
+    return cls
+
+
+def load_country_plugins():
+    """Import every ussd_scraper*.py module next to this file so they register.
+
+    Catalog files under catalogs/ without a scraper module are registered as
+    plain catalog countries, so adding a country can be a data-only change.
+    """
+    if SCRAPER_DIR not in sys.path:
+        sys.path.insert(0, SCRAPER_DIR)
+    for path in sorted(glob.glob(os.path.join(SCRAPER_DIR, 'ussd_scraper*.py'))):
+        importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+
+    for path in available_catalogs():
+        catalog = load_catalog_file(path)
+        if catalog['country_code'] not in COUNTRY_REGISTRY:
+            register_country(type(f"CatalogScraper_{catalog['country_code']}", (BaseUSSDScraper,), {
+                'country_code': catalog['country_code'],
+                'country_name': catalog['country_name'],
+                'slug': catalog['slug'],
+            }))
+
+
+def available_countries() -> List[str]:
+    """Registered country codes, in registration order"""
+    load_country_plugins()
+    return list(COUNTRY_REGISTRY)
+
+
+def get_scraper_class(country: str) -> Type['BaseUSSDScraper']:
+    """Look up a scraper by country code ('gh') or slug/name ('ghana', 'south_africa')"""
+    load_country_plugins()
+    key = country.strip().lower().replace(' ', '_')
+    if key in COUNTRY_REGISTRY:
+        return COUNTRY_REGISTRY[key]
+    for cls in COUNTRY_REGISTRY.values():
+        if key in (cls.slug, cls.country_name.lower().replace(' ', '_')):
+            return cls
+    raise KeyError(f"Unknown country '{country}', choose from: {', '.join(COUNTRY_REGISTRY)}")
+
+
+def configure_stdout():
+    """Make sure emoji progress output can be printed on any console"""
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+
+
+class BaseUSSDScraper:
+    """Common pipeline: collect() records, de-duplicate, stamp IDs and save.
+
+    Subclasses set the country attributes below. By default ``collect()`` adds
+    every section of the country's catalog (catalogs/<slug>.json); scrapers of
+    live pages override it and call ``scrape_generic_site``. The HTTP session
+    (and with it requests) is only created when a scraper actually fetches
+    something.
+    """
+
+    country_code = ''          # ISO-style code, also used as the record ID prefix
+    country_name = ''          # written to every record's 'country' field
+    slug = ''                  # dataset file name: ussd_codes_<slug>.json
+    code_pattern = USSD_CODE_PATTERN
+    default_provider = 'Unknown'
+    description_template = 'USSD service accessible via {code}'
+    start_message = ''
+    notes: Tuple[str, ...] = ()
+    total_label = 'Total Unique USSD Codes'
+    closing_note = ''
+
+    def __init__(self, concurrent: bool = False, max_workers: int = 8,
+                 requests_per_second: float = 1.0, burst: int = 1,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 parser_backend: str = DEFAULT_BACKEND, incremental: bool = False,
+                 exports: Optional[Iterable[str]] = None, stream: bool = False,
+                 spool_dir: Optional[str] = None, fuzzy_dedup: bool = True, resume: bool = False,
+                 work_queue: Optional[str] = None, queue_timeout: float = 600.0, retries: int = 2,
+                 failure_threshold: int = 4):
+        self.headers = dict(DEFAULT_HEADERS)
+        self.ussd_codes = []
+        self.concurrent = concurrent
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.cache_dir = cache_dir
+        self.parser_backend = parser_backend
+        self.prefetched = {}
+        self.http_cache = None
+        self.rate_limiter = None
+        # Retries of failed GETs, and how many consecutive failures cut a host off
+        self.retries = retries
+        self.failure_threshold = failure_threshold
+        self.circuit_breaker = None
+        self._session = None
+        self._catalog = None
+        self._dataset_index = None
+        # Per-source content hashes and records from the previous run
+        self.fingerprints = FingerprintStore(self.state_path()) if incremental else None
+        # Spool raw candidates to NDJSON while collecting instead of keeping them in memory
+        self.stream = stream
+        self.spool_dir = spool_dir
+        # Also collapse relabelled / generic-provider copies of the same code
+        self.fuzzy_dedup = fuzzy_dedup
+        # Finished pages and crawl frontiers are checkpointed while scraping; resume picks them up
+        self.resume = resume
+        self.checkpoint: Optional[CheckpointStore] = None
+        # Pages go to workers through this queue (see work_queue.open_queue) instead of being fetched here
+        self.queue_location = work_queue
+        self.work_queue: Optional[WorkQueue] = None
+        self.queued_keys: List[str] = []
+        self.queued_links: Dict[str, List] = {}
+        # Give up when no queued page has finished for this long (e.g. no worker is running)
+        self.queue_timeout = queue_timeout
+        self.queue_run = ''
+        # Sitemap/feed discovery results, reused by every collect() pass of a queue run
+        self.discovered_urls: Dict[Tuple[str, bool, int], List[str]] = {}
+        # Export stages run after every save (default: DEFAULT_EXPORTS)
+        self.exports = tuple(DEFAULT_EXPORTS if exports is None else exports)
+        unknown = set(self.exports) - set(EXPORT_STAGES)
+        if unknown:
+            raise ValueError(f"Unknown export stages: {', '.join(sorted(unknown))}")
+        if resume and work_queue:
+            raise ValueError("resume cannot be combined with a work queue: queue runs keep no checkpoint")
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    @property
+    def session(self):
+        """requests session with the HTTP cache, per-host rate limiter, retries and circuit breaker installed"""
+        if self._session is None:
+            from http_cache import CachingSession, HTTPCache
+            from rate_limit import HostRateLimiter
+            from resilience import CircuitBreaker, RetryPolicy, install_resilience
+
+            # Unchanged pages are revalidated with a conditional GET (cache_dir=None disables)
+            self.http_cache = HTTPCache(self.cache_dir) if self.cache_dir else None
+            self._session = CachingSession(self.http_cache)
+            # Politeness is enforced per origin by the session, not by fixed sleeps
+            self.rate_limiter = HostRateLimiter(self.requests_per_second, self.burst)
+            # Transient failures are retried with backoff; hosts that keep failing are skipped
+            self.circuit_breaker = CircuitBreaker(self.failure_threshold)
+            install_resilience(self._session, self.rate_limiter, RetryPolicy(self.retries), self.circuit_breaker)
+        return self._session
+
+    def fetch_page(self, url: str, verify_ssl: bool = True, timeout: int = 15):
+        """Fetch a page (revalidating any cached copy), raising on network or HTTP errors"""
+        response = self.session.get(url, headers=self.headers, timeout=timeout, verify=verify_ssl)
+        response.raise_for_status()
+        return response
+
+    def fetch_url(self, url: str, timeout: int = 10) -> str:
+        """Fetch content from URL with error handling"""
+        try:
+            return self.fetch_page(url, timeout=timeout).text
+        except Exception as e:
+            print(f"❌ Error fetching {url}: {e}")
+            return ""
+
+    def _prefetch_one(self, site: Tuple[str, bool]):
+        url, verify_ssl = site
+        try:
+            return self.fetch_page(url, verify_ssl), None
+        except Exception as e:
+            return None, e
+
+    def prefetch_sites(self, sites: List[Tuple[str, bool]]):
+        """Fetch many (url, verify_ssl) pairs concurrently ahead of parsing"""
+        if self.work_queue is not None:
+            return  # workers fetch the pages
+        sites = [site for site in dict.fromkeys(sites) if site[0] not in self.prefetched
+                 and not (self.checkpoint is not None and self.checkpoint.has_url(site[0]))]
+        if not sites:
+            return
+
+        print(f"⚡ Prefetching {len(sites)} pages concurrently...")
+        self.session  # create the shared session before worker threads use it
+        fetcher = ConcurrentFetcher(max_workers=self.max_workers)
+        results = fetcher.map(self._prefetch_one, sites, url_of=lambda site: site[0])
+        for (url, _), result in zip(sites, results):
+            self.prefetched[url] = result
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+
+    def extract_ussd_codes(self, text: str) -> List[str]:
+        """Extract USSD codes from text"""
+        codes = self.code_pattern.findall(text)
+        return list(dict.fromkeys(codes))  # Remove duplicates, keep page order
+
+    def extract_info_from_text(self, text: str, code: str) -> Tuple[str, str]:
+        """Extract name and description around a USSD code"""
+        return CodeContextIndex(text, self.code_pattern).info(code)
+
+    @property
+    def provider_matcher(self):
+        """Provider matcher for this country, or None if it has no registered providers"""
+        if self.country_code not in PROVIDER_REGISTRY:
+            return None
+        return get_provider_matcher(self.country_code)
+
+    def detect_provider(self, text: str, code: str, code_index: int = None) -> str:
+        """Try to detect the provider name from text around the code"""
+        if self.provider_matcher is None:
+            return ''
+        if code_index is None:
+            offsets = [match.start() for match in re.finditer(re.escape(code), text)]
+        else:
+            offsets = [code_index]
+        return self.provider_matcher.find_all(text).nearest(offsets, len(code))
+
+    def network_for(self, provider: str) -> str:
+        """Network recorded for codes scraped from a page"""
+        return 'All Networks'
+
+    def parse_page(self, url: str, content: bytes, category: str, provider: str = "") -> List[Dict]:
+        """Extract code records from a fetched page"""
+        records = []
+        # Visible text only (script, style, nav and footer are dropped)
+        text = extract_visible_text(content, self.parser_backend)
+
+        # Index every code with its sentence and offset in one pass
+        index = CodeContextIndex(text, self.code_pattern)
+        codes = index.codes()
+
+        print(f"  Found {len(codes)} codes on page")
+
+        # All provider mentions on the page, found once
+        matcher = self.provider_matcher
+        mentions = matcher.find_all(text) if matcher and not provider else None
+
+        for code in codes:
+            # Context around the code's first mention
+            name, description = index.info(code)
+
+            # Detect provider from the mention nearest to any occurrence of the code
+            code_provider = provider
+            if mentions is not None:
+                code_provider = mentions.nearest(index.offsets(code), len(code))
+
+            if not name:
+                name = f"{code_provider} - {code}" if code_provider else f"Service {code}"
+            if not description:
+                description = self.description_template.format(code=code)
+
+            records.append({
+                'name': name[:100].strip(),
+                'code': code,
+                'category': category,
+                'description': description[:200].strip(),
+                'provider': code_provider or self.default_provider,
+                'network': self.network_for(provider),
+                'source': url
+            })
+
+        return records
+
+    def scrape_generic_site(self, url: str, category: str, provider: str = "", verify_ssl: bool = True) -> int:
+        """Generic scraper for any website"""
+        print(f"🔍 Scraping {url}...")
+        parse_key = f'{category}|{provider}'
+        source_key = f'{url} {parse_key}'
+
+        if self.checkpoint is not None:
+            page = self.checkpoint.page(source_key)
+            if page is not None:
+                saved, digest = page
+                print(f"  ⏯️ Done before the restart, reusing {len(saved)} codes")
+                if self.fingerprints is not None and digest is not None:
+                    self.fingerprints.restore(source_key, digest, saved)
+                self.ussd_codes.extend(saved)
+                return len(saved)
+
+        if self.work_queue is not None:
+            return self.scrape_through_queue(url, category, provider, verify_ssl, source_key)
+
+        try:
+            if url in self.prefetched:
+                response, error = self.prefetched.pop(url)
+                if error is not None:
+                    raise error
+            else:
+                response = self.fetch_page(url, verify_ssl)
+
+            digest = None
+            if self.fingerprints is not None:
+                digest = fingerprint(response.content)
+                previous = self.fingerprints.lookup(source_key, digest)
+                if previous is not None:
+                    print(f"  ♻️ Unchanged since last run, reusing {len(previous)} codes")
+                    if self.checkpoint is not None:
+                        self.checkpoint.save_page(source_key, url, previous, digest)
+                    self.ussd_codes.extend(previous)
+                    return len(previous)
+
+            records = None
+            if response.from_cache:
+                records = self.http_cache.load_records(url, parse_key)
+                if records is not None:
+                    print(f"  ♻️ Not modified, reusing {len(records)} codes")
+
+            if records is None:
+                records = self.parse_page(url, response.content, category, provider)
+                if self.http_cache is not None:
+                    self.http_cache.store_records(url, parse_key, records)
+
+            if self.fingerprints is not None:
+                self.fingerprints.update(source_key, digest, records)
+            if self.checkpoint is not None:
+                self.checkpoint.save_page(source_key, url, records, digest)
+
+            self.ussd_codes.extend(records)
+            return len(records)
+
+        except Exception as e:
+            print(f"  ❌ Error: {str(e)[:100]}")
+
+        # Keep the last good records for a source that failed this time
+        if self.fingerprints is not None:
+            previous = self.fingerprints.last_records(source_key)
+            if previous:
+                print(f"  ♻️ Keeping {len(previous)} codes from the last successful run")
+                self.ussd_codes.extend(previous)
+                return len(previous)
+
+        return 0
+
+    def scrape_through_queue(self, url: str, category: str, provider: str, verify_ssl: bool,
+                             source_key: str) -> int:
+        """Use the records a worker returned for this page, or queue the page for the workers"""
+        key = f'{self.country_code} {self.queue_run} {source_key}'
+        status = self.work_queue.status(key)
+        if status is None:
+            self.work_queue.put(key, {'country': self.country_code, 'url': url, 'category': category,
+                                      'provider': provider, 'verify_ssl': verify_ssl})
+        if status is None or status.state not in (DONE, FAILED):
+            print("  📬 Queued for workers")
+            self.queued_keys.append(key)
+            return 0
+        if status.state == FAILED:
+            print(f"  ❌ Error: {status.error[:100]}")
+            return 0
+
+        records = status.result['records']
+        print(f"  📥 {len(records)} codes from a worker")
+        self.queued_links[url] = status.result['links']
+        self.ussd_codes.extend(records)
+        return len(records)
+
+    def scrape_work_item(self, payload: Dict) -> Dict:
+        """Fetch and parse one queued page (worker side); errors propagate so the queue retries"""
+        url = payload['url']
+        if url in self.prefetched:
+            response, error = self.prefetched.pop(url)
+            if error is not None:
+                raise error
+        else:
+            response = self.fetch_page(url, payload['verify_ssl'])
+        records = self.parse_page(url, response.content, payload['category'], payload['provider'])
+        return {'records': records, 'links': site_links(url, response.content)}
+
+    def crawl_sites(self, sites: List[Tuple[str, bool]], category: str, provider: str = "",
+                    max_depth: int = 2, max_pages_per_site: int = 15, max_pages: int = 120) -> int:
+        """Scrape ``sites`` and follow their most promising same-site links, within budgets"""
+        crawler = Crawler(max_depth=max_depth, max_pages_per_site=max_pages_per_site, max_pages=max_pages)
+        crawl_key = 'crawl:' + fingerprint(sites, category, provider)
+        saved = self.checkpoint.frontier(crawl_key) if self.checkpoint is not None else None
+        count = 0
+        scraped: List[Tuple[str, bool]] = []
+        if saved is not None:
+            crawler.restore(saved)
+            print(f"⏯️ Resuming crawl: {crawler.fetched} pages done, {len(crawler.frontier)} queued")
+            # Pages finished before the restart come back from the checkpoint, not the network
+            for url, verify_ssl in saved['scraped']:
+                count += self.scrape_generic_site(url, category, provider, verify_ssl=verify_ssl)
+                scraped.append((url, verify_ssl))
+        else:
+            for url, verify_ssl in sites:
+                crawler.add_seed(url, verify_ssl)
+
+        # One page per site per round, so each round's links reprioritize the next
+        while True:
+            batch = crawler.next_batch(self.max_workers)
+            if not batch:
+                break
+            self.prefetch_sites([(item.url, item.verify_ssl) for item in batch])
+            for position, item in enumerate(batch):
+                # scrape_generic_site() consumes the prefetched response; its links are needed here too
+                response, _ = self.prefetched.get(item.url, (None, None))
+                found = self.scrape_generic_site(item.url, category, provider, verify_ssl=item.verify_ssl)
+                count += found
+                if response is not None:
+                    crawler.add_links(item, response.content, found)
+                elif item.url in self.queued_links:
+                    crawler.queue_links(item, self.queued_links.pop(item.url), found)
+                scraped.append((item.url, item.verify_ssl))
+                if self.checkpoint is not None:
+                    state = crawler.state(pending=batch[position + 1:])
+                    state['scraped'] = list(scraped)
+                    self.checkpoint.save_frontier(crawl_key, state)
+
+        print(f"🕸️ Crawled {crawler.fetched} pages on {len(crawler.pages_per_site)} sites, {count} codes")
+        return count
+
+    def discover_urls(self, site_url: str, verify_ssl: bool = True, max_urls: int = 20) -> List[str]:
+        """Keyword-matching pages of a site, from its sitemaps and RSS/Atom feeds"""
+        def get(url):
+            return self.session.get(url, headers=self.headers, timeout=15, verify=verify_ssl, stream=True)
+        return SitemapDiscovery(get, max_urls=max_urls).discover(site_url)
+
+    def scrape_discovered(self, sites: List[Tuple[str, str, str, bool]], max_urls: int = 20) -> int:
+        """Scrape the USSD-related pages that sitemaps and feeds list for each (url, provider,
+        category, verify_ssl) site, instead of only its homepage"""
+        print(f"🗺️ Discovering pages from sitemaps and feeds of {len(sites)} sites...")
+        self.session  # create the shared session before worker threads use it
+        fetcher = ConcurrentFetcher(max_workers=self.max_workers if self.concurrent else 1)
+        undiscovered = list(dict.fromkeys((url, verify_ssl, max_urls) for url, _, _, verify_ssl in sites
+                                          if (url, verify_ssl, max_urls) not in self.discovered_urls))
+        found = fetcher.map(lambda site: self.discover_urls(*site), undiscovered, url_of=lambda site: site[0])
+        self.discovered_urls.update(zip(undiscovered, found))
+        discovered = [self.discovered_urls[url, verify_ssl, max_urls] for url, _, _, verify_ssl in sites]
+
+        pages = []
+        for (_, provider, category, verify_ssl), urls in zip(sites, discovered):
+            pages.extend((url, provider, category, verify_ssl) for url in urls)
+        print(f"  Found {len(pages)} candidate pages")
+        if not pages:
+            return 0
+
+        self.prefetch_sites([(url, verify_ssl) for url, _, _, verify_ssl in pages])
+        count = 0
+        for url, provider, category, verify_ssl in pages:
+            count += self.scrape_generic_site(url, category, provider, verify_ssl=verify_ssl)
+        return count
+
+    # ------------------------------------------------------------------
+    # Pipeline
+    # ------------------------------------------------------------------
+
+    @property
+    def catalog(self) -> Dict:
+        """This country's static code catalog (loaded once, through the binary cache)"""
+        if self._catalog is None:
+            self._catalog = load_catalog(self.slug)
+        return self._catalog
+
+    def catalog_codes(self, key: str) -> List[Dict]:
+        """Fresh copies of the records in one catalog section"""
+        for section in self.catalog['sections']:
+            if section['key'] == key:
+                return [dict(record) for record in section['codes']]
+        raise KeyError(f"{self.slug} catalog has no section '{key}'")
+
+    def add_catalog_section(self, section: Dict) -> int:
+        """Add one catalog section's codes, with its progress messages"""
+        if section.get('title'):
+            print(section['title'])
+
+        codes = None
+        if self.fingerprints is not None:
+            key = f"catalog:{section['key']}"
+            digest = fingerprint(section['codes'])
+            codes = self.fingerprints.lookup(key, digest)
+            if codes is None:
+                codes = [dict(record) for record in section['codes']]
+                self.fingerprints.update(key, digest, codes)
+        if codes is None:
+            codes = [dict(record) for record in section['codes']]
+
+        self.ussd_codes.extend(codes)
+        if section.get('summary'):
+            print(section['summary'].format(count=len(codes)))
+        return len(codes)
+
+    def collect(self):
+        """Add this country's records to self.ussd_codes"""
+        for section in self.catalog['sections']:
+            self.add_catalog_section(section)
+
+    @staticmethod
+    def deduplicate(records: Iterable[Dict]) -> List[Dict]:
+        """Drop records whose (code, provider) pair was already seen (streams any iterable)"""
+        seen_codes = set()
+        unique_codes = []
+        for code_data in records:
+            code_key = (code_data['code'], code_data['provider'])
+            if code_key not in seen_codes:
+                seen_codes.add(code_key)
+                unique_codes.append(code_data)
+        return unique_codes
+
+    def scrape_all(self):
+        """Collect all USSD codes for this country"""
+        print(self.start_message or f"🚀 Starting {self.country_name} USSD Code Collection...")
+        print("=" * 50)
+        if self.notes:
+            for note in self.notes:
+                print(note)
+            print("=" * 50)
+
+        if self.queue_location:
+            self.ussd_codes = self.collect_through_queue()
+        else:
+            self.checkpoint = CheckpointStore(self.checkpoint_path(), resume=self.resume)
+            if self.checkpoint.resumed_pages:
+                print(f"⏯️ Resuming: {self.checkpoint.resumed_pages} pages already scraped")
+            try:
+                self.ussd_codes = self.collect_unique()
+            except BaseException:
+                # Keep what was scraped so far for --resume
+                self.checkpoint.close()
+                raise
+            else:
+                self.checkpoint.finish()
+            finally:
+                self.checkpoint = None
+
+        if self.circuit_breaker is not None and self.circuit_breaker.open_hosts():
+            hosts = self.circuit_breaker.open_hosts()
+            print(f"🔌 Gave up on {len(hosts)} failing hosts: {', '.join(hosts)}")
+
+        if self.fuzzy_dedup:
+            before = len(self.ussd_codes)
+            self.ussd_codes = merge_near_duplicates(self.ussd_codes, self.country_name, self.default_provider)
+            if len(self.ussd_codes) < before:
+                print(f"🧬 Merged {before - len(self.ussd_codes)} near-duplicate codes")
+
+        if self.fingerprints is not None:
+            self.fingerprints.save()
+            print(f"♻️ Incremental: {self.fingerprints.reused} sources reused, "
+                  f"{self.fingerprints.changed} changed")
+
+        print("=" * 50)
+        print(f"✨ {self.total_label}: {len(self.ussd_codes)}")
+        if self.closing_note:
+            print(self.closing_note)
+
+        return self.ussd_codes
+
+    def collect_unique(self) -> List[Dict]:
+        """collect() and drop exact duplicates"""
+        if not self.stream:
+            self.collect()
+            return self.deduplicate(self.ussd_codes)
+
+        # Only the (code, provider) keys and unique records stay in memory
+        spool = self.ussd_codes = RecordSpool(self.spool_dir)
+        try:
+            self.collect()
+            unique = self.deduplicate(spool)
+        finally:
+            spool.close()
+        print(f"🧹 Streamed {len(spool)} candidates from the spool, {len(unique)} unique")
+        return unique
+
+    def collect_through_queue(self) -> List[Dict]:
+        """Run collect() with pages scraped by queue workers.
+
+        Each pass queues the pages that have no result yet and waits for the
+        workers; crawls get one level deeper per pass, as the links of newly
+        finished pages come back. The last pass, with nothing left to wait
+        for, gives the records. Items are keyed by a new run id, and the
+        country's items from earlier runs are dropped first, so every run
+        scrapes the pages again.
+        """
+        self.work_queue = open_queue(self.queue_location)
+        self.queue_run = uuid.uuid4().hex[:12]
+        dropped = self.work_queue.discard(f'{self.country_code} ')
+        if dropped:
+            print(f"🧹 Dropped {dropped} queue items of earlier runs")
+        try:
+            while True:
+                self.ussd_codes, self.queued_keys, self.queued_links = [], [], {}
+                unique = self.collect_unique()
+                if not self.queued_keys:
+                    return unique
+                print(f"📬 Waiting for workers to scrape {len(self.queued_keys)} queued pages...")
+                self.work_queue.wait_for(self.queued_keys, timeout=self.queue_timeout)
+        finally:
+            self.work_queue.close()
+            self.work_queue = None
+
+    def state_path(self) -> str:
+        return os.path.join(STATE_DIR, f'{self.slug}.json')
+
+    def checkpoint_path(self) -> str:
+        return os.path.join(STATE_DIR, f'{self.slug}.checkpoint.sqlite')
+
+    def default_output_path(self, extension: str = 'json') -> str:
+        return os.path.join(DATASET_DIR, f'ussd_codes_{self.slug}.{extension}')
+
+    def save_to_json(self, filename: str = None):
+        """Save scraped USSD codes to JSON file"""
+        filename = filename or self.default_output_path()
+
+        # IDs come from (country, code, provider), so they survive reordering
+        assign_stable_ids(self.ussd_codes, self.country_code, self.country_name)
+        for code in self.ussd_codes:
+            code['country'] = self.country_name
+            code['last_updated'] = LAST_UPDATED
+        self._dataset_index = None
+
+        content = json.dumps(self.ussd_codes, indent=2, ensure_ascii=False).encode('utf-8')
+        # The previous export is what the patch stage diffs against
+        try:
+            with open(filename, 'rb') as f:
+                previous = f.read()
+        except OSError:
+            previous = None
+
+        if write_if_changed(filename, content):
+            print(f"\n💾 Saved {len(self.ussd_codes)} USSD codes to {filename}")
+        else:
+            print(f"\n💾 {filename} is already up to date ({len(self.ussd_codes)} USSD codes)")
+
+        for stage in self.exports:
+            getattr(self, f'export_{stage}')(filename, previous, content)
+
+    def export_patches(self, filename: str, previous: Optional[bytes], content: bytes):
+        """Write the delta from the previous export and update the version manifest"""
+        exporter = DeltaExporter(os.path.dirname(filename), self.slug, self.country_name)
+        patch = exporter.export(previous, content, self.ussd_codes)
+        if patch:
+            print(f"🩹 Patch {patch['file']}: +{patch['added']} -{patch['removed']} "
+                  f"~{patch['changed']} ({patch['size']} bytes)")
+
+    @staticmethod
+    def unbundled_path(filename: str, directory: str, suffix: str) -> str:
+        """<directory>/ussd_codes_<slug><suffix> next to the dataset, outside the files the app bundles"""
+        name = os.path.splitext(os.path.basename(filename))[0] + suffix
+        return os.path.join(os.path.dirname(filename), directory, name)
+
+    def ussdb_path(self, filename: str) -> str:
+        return self.unbundled_path(filename, compact_format.COMPACT_DIR_NAME, '.ussdb')
+
+    def prefix_path(self, filename: str) -> str:
+        return self.unbundled_path(filename, code_prefix.PREFIX_DIR_NAME, '.prefix.json')
+
+    @property
+    def dataset_index(self) -> CodeIndex:
+        """CodeIndex over the records being saved, built once per save"""
+        if self._dataset_index is None:
+            self._dataset_index = CodeIndex(self.ussd_codes, self.country_name)
+        return self._dataset_index
+
+    def export_ussdb(self, filename: str, previous: Optional[bytes], content: bytes):
+        """Write the compact columnar copy of the dataset (compact/ussd_codes_<slug>.ussdb)"""
+        path = self.ussdb_path(filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = compact_format.dumps(self.ussd_codes)
+        if write_if_changed(path, data):
+            print(f"📦 Saved {os.path.basename(path)} ({len(data):,} bytes, JSON {len(content):,} bytes)")
+
+    def export_search(self, filename: str, previous: Optional[bytes], content: bytes):
+        """Write the prebuilt search index for the app (ussd_codes_<slug>.search.json)"""
+        path = os.path.splitext(filename)[0] + '.search.json'
+        data = search_index.dumps(search_index.build_index(self.ussd_codes, self.country_name))
+        if write_if_changed(path, data):
+            print(f"🔎 Saved {os.path.basename(path)} ({len(data):,} bytes)")
+
+    def export_sections(self, filename: str, previous: Optional[bytes], content: bytes):
+        """Write the dataset grouped, sorted and display-ready (ussd_codes_<slug>.sections.json)"""
+        path = os.path.splitext(filename)[0] + '.sections.json'
+        data = sectioned_export.dumps(self.ussd_codes, self.country_name)
+        if write_if_changed(path, data):
+            print(f"🗂️ Saved {os.path.basename(path)} ({len(data):,} bytes)")
+
+    def export_prefix(self, filename: str, previous: Optional[bytes], content: bytes):
+        """Write the sorted codes for dialed-string lookups (prefix/ussd_codes_<slug>.prefix.json)"""
+        path = self.prefix_path(filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = code_prefix.dumps(self.dataset_index)
+        if write_if_changed(path, data):
+            print(f"📟 Saved {os.path.basename(path)} ({len(data):,} bytes)")
+
+    def export_compressed(self, filename: str, previous: Optional[bytes], content: bytes):
+        """Write gzip/brotli/zstd copies of the exported files with a size and hash manifest"""
+        paths = [filename]
+        if 'ussdb' in self.exports:
+            paths.append(self.ussdb_path(filename))
+        if 'search' in self.exports:
+            paths.append(os.path.splitext(filename)[0] + '.search.json')
+        if 'sections' in self.exports:
+            paths.append(os.path.splitext(filename)[0] + '.sections.json')
+        if 'prefix' in self.exports:
+            paths.append(self.prefix_path(filename))
+        directory = os.path.join(os.path.dirname(filename), COMPRESSED_DIR_NAME, self.slug)
+        manifest = precompress(paths, directory)
+        for name, entry in manifest['files'].items():
+            sizes = ', '.join(f"{codec} {encoding['size']:,}" for codec, encoding in entry['encodings'].items())
+            print(f"🗜️ {name}: {sizes} bytes")
+
+    def save_to_ndjson(self, filename: str = None):
+        """Save scraped USSD codes as newline-delimited JSON, one record per line"""
+        filename = filename or self.default_output_path('ndjson')
+        count = write_ndjson(filename, self.ussd_codes)
+        print(f"💾 Saved {count} USSD codes to {filename}")
+
+    def save_to_excel(self, filename: str = None):
+        """Save scraped USSD codes to Excel file"""
+        filename = filename or self.default_output_path('xlsx')
+        try:
+            import pandas as pd
+
+            df = pd.DataFrame(self.ussd_codes)
+            df.to_excel(filename, index=False)
+            print(f"💾 Saved {len(self.ussd_codes)} USSD codes to {filename}")
+        except ImportError:
+            print("❌ pandas not installed. Run: pip install pandas openpyxl")
+
+    def run(self, filename: str = None) -> List[Dict]:
+        """Scrape, save to the dataset directory and print a short summary"""
+        ussd_codes = self.scrape_all()
+        self.save_to_json(filename)
+
+        print("\n✅ Scraping Complete!")
+        print(f"📊 Categories: {len(set(code['category'] for code in ussd_codes))}")
+        print(f"🏢 Providers: {len(set(code['provider'] for code in ussd_codes))}")
+        conflicts = self.dataset_index.conflicts()
+        if conflicts:
+            print(f"🔀 Codes claimed by several providers on one network: {len(conflicts)}")
+        return ussd_codes
+
+
+def run_country(country: str, filename: str = None, **options) -> List[Dict]:
+    """Run one registered country's pipeline end to end (scrape, save, summarize)"""
+    return get_scraper_class(country)(**options).run(filename)
@@ -0,0 +1,94 @@
+"""
+Microbenchmark for the dialed-string queries of code_index.CodeIndex
+Compares binary-search prefix, exact and longest-known-prefix lookups with linear scans over
+every country's codes (optionally padded with synthetic codes)
+
+Usage:
+    python bench_code_prefix.py                    # codes from ../assets/dataset
+    python bench_code_prefix.py --synthetic 200000 # plus 200k generated codes
+"""
+
+import glob
+import json
+import os
+import random
+import sys
+import time
+
+import code_prefix
+from code_index import CodeIndex
+
+DATASET_GLOB = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets', 'dataset',
+                            'ussd_codes_*.json')
+
+
+def load_records(synthetic: int):
+    records = []
+    for path in sorted(glob.glob(DATASET_GLOB)):
+        with open(path, encoding='utf-8') as f:
+            records.extend(json.load(f))
+    rng = random.Random(3)
+    for i in range(synthetic):
+        segments = [str(rng.randint(100, 999))] + [str(rng.randint(0, 99)) for _ in range(rng.randint(0, 3))]
+        records.append({'id': f'syn_{i}', 'code': '*' + '*'.join(segments) + '#'})
+    return records
+
+
+def scan_prefix(codes, prefix):
+    return sorted(code for code in codes if code.startswith(prefix))
+
+
+def scan_longest(codes, dialed):
+    best = 0
+    for code in codes:
+        length = 0
+        for a, b in zip(dialed, code):
+            if a != b:
+                break
+            length += 1
+        best = max(best, length)
+    return dialed[:best]
+
+
+def timed(function, queries, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [function(query) for query in queries]
+    return results, (time.perf_counter() - start) / (len(queries) * repeat)
+
+
+def main():
+    args = sys.argv[1:]
+    synthetic = int(args[args.index('--synthetic') + 1]) if '--synthetic' in args else 0
+    records = load_records(synthetic)
+
+    start = time.perf_counter()
+    # All countries' codes in one keyspace, as the bench compares against a single list
+    index = CodeIndex(({'id': record['id'], 'code': record['code']} for record in records))
+    build_seconds = time.perf_counter() - start
+    codes = index.sorted_codes['']
+
+    rng = random.Random(5)
+    sample = rng.sample(codes, min(200, len(codes)))
+    prefixes = [code[:rng.randint(2, len(code))] for code in sample]
+    dialed = [code.rstrip('#') + '*' + str(rng.randint(1, 9)) for code in sample]
+
+    print(f"📟 {len(records):,} records, {len(codes):,} distinct codes "
+          f"(built in {build_seconds * 1000:.1f} ms, {len(code_prefix.dumps(index)):,} bytes serialized)")
+    print("=" * 60)
+    rows = [
+        ('exact', lambda q: q in codes, index.records_for, sample),
+        ('prefix', lambda q: scan_prefix(codes, q), index.codes_with_prefix, prefixes),
+        ('longest prefix', lambda q: scan_longest(codes, q), index.longest_known_prefix, dialed),
+    ]
+    for label, scan, probe, queries in rows:
+        scan_results, scan_time = timed(scan, queries)
+        probe_results, probe_time = timed(probe, queries, repeat=20)
+        if label != 'exact':
+            assert scan_results == probe_results, f'{label}: scan and index disagree'
+        print(f"{label:>15}: scan {scan_time * 1e6:9.1f} µs   index {probe_time * 1e6:7.2f} µs   "
+              f"({scan_time / probe_time:,.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark for the compact columnar dataset format in compact_format.py
+Compares file size (raw and gzipped) and decode time against the pretty-printed JSON datasets
+
+Usage:
+    python bench_compact_format.py                         # every ../assets/dataset/ussd_codes_*.json
+    python bench_compact_format.py ussd_codes_ghana.json   # specific files
+    python bench_compact_format.py --scale 200             # also repeat each dataset 200x
+"""
+
+import glob
+import gzip
+import json
+import os
+import sys
+import time
+
+import compact_format
+
+DATASET_GLOB = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets', 'dataset',
+                            'ussd_codes_*.json')
+
+
+def bench(decode, data: bytes, min_seconds: float = 0.5) -> float:
+    """Seconds per decode"""
+    decode(data)  # warm up
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        decode(data)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / runs
+
+
+def compare(label: str, records):
+    json_bytes = json.dumps(records, indent=2, ensure_ascii=False).encode('utf-8')
+    ussdb_bytes = compact_format.dumps(records)
+    assert compact_format.loads(ussdb_bytes) == records
+
+    json_time = bench(json.loads, json_bytes)
+    ussdb_time = bench(compact_format.loads, ussdb_bytes)
+    print(f"{label:<28}{len(records):>7}"
+          f"{len(json_bytes):>10,}{len(ussdb_bytes):>9,} ({len(ussdb_bytes) / len(json_bytes):4.0%})"
+          f"{len(gzip.compress(json_bytes, 9)):>10,}{len(gzip.compress(ussdb_bytes, 9)):>10,}"
+          f"{json_time * 1e6:>10.0f}{ussdb_time * 1e6:>10.0f}")
+    return len(json_bytes), len(ussdb_bytes), json_time, ussdb_time
+
+
+def main():
+    args = sys.argv[1:]
+    scale = 1
+    if '--scale' in args:
+        position = args.index('--scale')
+        scale = int(args[position + 1])
+        del args[position:position + 2]
+    paths = args or sorted(glob.glob(DATASET_GLOB))
+
+    print(f"{'Dataset':<28}{'Codes':>7}{'JSON':>10}{'.ussdb':>16}{'JSON.gz':>10}{'.ussdb.gz':>10}"
+          f"{'JSON µs':>10}{'ussdb µs':>10}")
+    print("=" * 101)
+    totals = [0, 0, 0.0, 0.0]
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            records = json.load(f)
+        label = os.path.basename(path)
+        if scale > 1:
+            records = [dict(record, id=f"{record['id']}.{i}") for i in range(scale) for record in records]
+            label = f"{label} x{scale}"
+        for i, value in enumerate(compare(label, records)):
+            totals[i] += value
+
+    print("=" * 101)
+    print(f"📦 Size: {totals[1]:,} / {totals[0]:,} bytes ({totals[1] / totals[0]:.0%} of JSON)")
+    print(f"⚡ Decode: {totals[3] / totals[2]:.2f}x the time of json.loads (below 1 is faster)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark for the visible-text parser backends in html_text.py
+Compares throughput on a large news homepage (live, from a saved file, or a synthetic stand-in)
+
+Usage:
+    python bench_html_text.py                          # fetch https://www.myjoyonline.com
+    python bench_html_text.py saved_homepage.html      # use a saved copy
+    python bench_html_text.py --synthetic              # offline, generated page
+"""
+
+import sys
+import time
+
+from html_text import PARSER_BACKENDS
+
+DEFAULT_URL = 'https://www.myjoyonline.com'
+
+
+def synthetic_news_homepage(articles: int = 1500) -> bytes:
+    """A news-homepage-shaped document: heavy nav, inline scripts, many teaser blocks"""
+    nav = ''.join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(200))
+    parts = [
+        '<!DOCTYPE html><html><head><title>News</title>',
+        '<style>' + '.teaser{margin:0 auto;padding:4px}' * 200 + '</style>',
+        '</head><body>',
+        f'<nav><ul>{nav}</ul></nav>',
+    ]
+    for i in range(articles):
+        parts.append(
+            f'<article class="teaser"><h2><a href="/news/{i}">Headline number {i} about the economy</a></h2>'
+            f'<p>Customers can now dial *{170 + i % 700}# to access mobile money and *920*{i % 90}# '
+            f'to pay bills. Read more about story {i} here.</p>'
+            f'<script>window.dataLayer.push({{"article": {i}, "slot": "teaser"}});</script></article>'
+        )
+    parts.append('<footer>' + '<a href="/about">About</a>' * 100 + '</footer></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def load_page(args) -> (str, bytes):
+    if '--synthetic' in args:
+        return 'synthetic news homepage', synthetic_news_homepage()
+    if args:
+        with open(args[0], 'rb') as f:
+            return args[0], f.read()
+    try:
+        import requests
+        response = requests.get(DEFAULT_URL, timeout=15, headers={'User-Agent': 'Mozilla/5.0'})
+        response.raise_for_status()
+        return DEFAULT_URL, response.content
+    except Exception as e:
+        print(f"⚠️ Could not fetch {DEFAULT_URL} ({str(e)[:80]}), using a synthetic page")
+        return 'synthetic news homepage', synthetic_news_homepage()
+
+
+def bench(parse, content: bytes, min_seconds: float = 2.0) -> (int, float):
+    parse(content)  # warm up
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        parse(content)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return runs, elapsed
+
+
+def main():
+    label, content = load_page(sys.argv[1:])
+    size_mb = len(content) / 1_000_000
+    print(f"📄 {label}: {len(content):,} bytes")
+    print("=" * 50)
+
+    results = {}
+    for name, parse in PARSER_BACKENDS.items():
+        try:
+            runs, elapsed = bench(parse, content)
+        except ImportError as e:
+            print(f"{name:>12}: skipped ({e})")
+            continue
+        results[name] = runs / elapsed
+        print(f"{name:>12}: {runs / elapsed:8.1f} pages/s  {runs * size_mb / elapsed:8.1f} MB/s  "
+              f"({elapsed / runs * 1000:.1f} ms/page)")
+
+    if 'lxml' in results and 'html.parser' in results:
+        print("=" * 50)
+        print(f"⚡ lxml speedup: {results['lxml'] / results['html.parser']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark for the prebuilt search index in search_index.py
+Replays search-as-you-type queries (every prefix of words and codes from the dataset) through
+a port of USSDDataService.searchUSSDCodes and through index probes, checking both agree
+
+Usage:
+    python bench_search_index.py                               # Ghana dataset
+    python bench_search_index.py ../assets/dataset/ussd_codes_kenya.json
+    python bench_search_index.py --scale 50                    # dataset repeated 50x
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+from app_fields import display_provider
+from search_index import SearchIndex, build_index
+
+DEFAULT_DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets', 'dataset',
+                               'ussd_codes_ghana.json')
+
+
+def scan_search(query: str, records):
+    """searchUSSDCodes as the app runs it: lowercase and scan every record"""
+    if not query:
+        return []
+    lower = query.lower()
+    return [record for record in records
+            if lower in record['name'].lower() or lower in record['description'].lower()
+            or lower in display_provider(record).lower() or query in record['code']]
+
+
+def typed_queries(records, count: int = 400):
+    """Prefixes of words and codes, as a user types them"""
+    words = set()
+    for record in records:
+        words.update(record['name'].split())
+        words.add(record['code'])
+    rng = random.Random(7)
+    queries = []
+    for word in sorted(words):
+        queries.extend(word[:length] for length in range(1, min(len(word), 8) + 1))
+    rng.shuffle(queries)
+    return queries[:count]
+
+
+def timed(search, queries):
+    start = time.perf_counter()
+    results = [search(query) for query in queries]
+    return results, (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    args = sys.argv[1:]
+    scale = 1
+    if '--scale' in args:
+        position = args.index('--scale')
+        scale = int(args[position + 1])
+        del args[position:position + 2]
+    path = args[0] if args else DEFAULT_DATASET
+
+    with open(path, encoding='utf-8') as f:
+        records = json.load(f)
+    records = [dict(record, id=f"{record['id']}.{i}") for i in range(scale) for record in records]
+
+    start = time.perf_counter()
+    index = build_index(records)
+    build_seconds = time.perf_counter() - start
+    engine = SearchIndex(json.loads(json.dumps(index)), records)
+    queries = typed_queries(records)
+
+    scan_results, scan_time = timed(lambda query: scan_search(query, records), queries)
+    index_results, index_time = timed(engine.search, queries)
+    assert scan_results == index_results, 'index and scan disagree'
+
+    print(f"📄 {os.path.basename(path)} x{scale}: {len(records)} codes, {len(queries)} queries")
+    print(f"🏗️ Index build: {build_seconds * 1000:.1f} ms, "
+          f"{len(json.dumps(index, separators=(',', ':'))):,} bytes")
+    print("=" * 50)
+    print(f"{'full scan':>12}: {scan_time * 1e6:8.1f} µs/query")
+    print(f"{'index':>12}: {index_time * 1e6:8.1f} µs/query")
+    print("=" * 50)
+    print(f"⚡ Index speedup: {scan_time / index_time:.1f}x (identical results)")
+
+
+if __name__ == '__main__':
+    main()
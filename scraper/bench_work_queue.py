@@ -0,0 +1,68 @@
+"""
+Throughput benchmark for work_queue.SQLiteWorkQueue
+Worker processes lease, "fetch" (sleep for a simulated page latency) and complete synthetic
+items; pages per second should grow about linearly with the number of workers
+
+Usage:
+    python bench_work_queue.py                       # 1, 2, 4, 8 workers, 400 items, 20 ms pages
+    python bench_work_queue.py --items 2000 --latency 0.05
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from work_queue import SQLiteWorkQueue
+
+
+def worker(path: str, name: str, latency: float, batch_size: int) -> int:
+    queue = SQLiteWorkQueue(path)
+    completed = 0
+    while True:
+        items = queue.lease(name, batch_size)
+        if not items:
+            break
+        for item in items:
+            time.sleep(latency)
+            completed += queue.complete(item, {'records': [{'code': f"*{item.payload['n']}#"}], 'links': []})
+    queue.close()
+    return completed
+
+
+def run(workers: int, items: int, latency: float, batch_size: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'queue.sqlite')
+        queue = SQLiteWorkQueue(path)
+        queue.put_many((f'item {n}', {'n': n}) for n in range(items))
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(worker, path, f'w{i}', latency, batch_size) for i in range(workers)]
+            completed = sum(future.result() for future in futures)
+        seconds = time.perf_counter() - start
+
+        assert completed == items and queue.counts()['done'] == items, 'items lost or done twice'
+        queue.close()
+    return seconds
+
+
+def main():
+    args = sys.argv[1:]
+    items = int(args[args.index('--items') + 1]) if '--items' in args else 400
+    latency = float(args[args.index('--latency') + 1]) if '--latency' in args else 0.02
+    batch_size = int(args[args.index('--batch-size') + 1]) if '--batch-size' in args else 4
+
+    print(f"📬 {items} items, {latency * 1000:.0f} ms per page, batches of {batch_size}")
+    print("=" * 60)
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        seconds = run(workers, items, latency, batch_size)
+        rate = items / seconds
+        baseline = baseline or rate
+        print(f"{workers:>2} workers: {seconds:6.2f} s   {rate:7.1f} pages/s   ({rate / baseline:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
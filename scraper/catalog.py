@@ -0,0 +1,85 @@
+"""
+Static USSD code catalogs
+Known codes for each country live in versioned JSON files under catalogs/ and are loaded
+through a precompiled marshal cache (kept in catalogs/__pycache__, like .pyc files), so a
+run is one bulk read instead of executing thousands of dict literals
+"""
+
+import glob
+import json
+import marshal
+import os
+import sys
+from typing import Dict, List
+
+from fileio import write_atomic
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'catalogs')
+CATALOG_VERSION = 1
+REQUIRED_FIELDS = ('name', 'code', 'category', 'description', 'provider', 'network')
+
+# Bump when the cached layout changes; stale caches are rebuilt automatically
+_CACHE_FORMAT = 1
+
+
+def catalog_path(slug: str) -> str:
+    return os.path.join(CATALOG_DIR, f'{slug}.json')
+
+
+def _cache_path(source: str) -> str:
+    name = os.path.splitext(os.path.basename(source))[0]
+    tag = sys.implementation.cache_tag or 'python'
+    return os.path.join(os.path.dirname(source), '__pycache__', f'{name}.{tag}.catalog')
+
+
+def _validate(catalog: Dict, source: str):
+    if catalog.get('version') != CATALOG_VERSION:
+        raise ValueError(f"{source}: unsupported catalog version {catalog.get('version')!r}")
+    for section in catalog.get('sections', []):
+        for index, record in enumerate(section.get('codes', [])):
+            missing = [field for field in REQUIRED_FIELDS if field not in record]
+            if missing:
+                raise ValueError(f"{source}: section '{section.get('key')}' record {index} "
+                                 f"is missing {', '.join(missing)}")
+
+
+def _read_cache(cache: str, stamp: tuple):
+    try:
+        with open(cache, 'rb') as f:
+            header, catalog = marshal.loads(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    return catalog if header == stamp else None
+
+
+def _write_cache(cache: str, stamp: tuple, catalog: Dict):
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        write_atomic(cache, marshal.dumps((stamp, catalog)))
+    except OSError:
+        pass  # read-only checkout: just parse the JSON every time
+
+
+def load_catalog_file(source: str) -> Dict:
+    """Load a catalog JSON file, using (and refreshing) its binary cache"""
+    info = os.stat(source)
+    stamp = (_CACHE_FORMAT, info.st_mtime_ns, info.st_size)
+    cache = _cache_path(source)
+
+    catalog = _read_cache(cache, stamp)
+    if catalog is None:
+        with open(source, encoding='utf-8') as f:
+            catalog = json.load(f)
+        _validate(catalog, source)
+        _write_cache(cache, stamp, catalog)
+    return catalog
+
+
+def load_catalog(slug: str) -> Dict:
+    """Catalog for a country slug, e.g. load_catalog('nigeria')"""
+    return load_catalog_file(catalog_path(slug))
+
+
+def available_catalogs() -> List[str]:
+    """Paths of every catalog file, sorted by name"""
+    return sorted(glob.glob(os.path.join(CATALOG_DIR, '*.json')))
@@ -0,0 +1,119 @@
+"""
+Checkpoint and resume for long scrape runs
+Extracted records of every finished page and the crawl frontier are kept in a local SQLite
+file and committed every few seconds, so a run that dies halfway (network drop, Ctrl-C) can
+be restarted with --resume and skip everything it already fetched
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+CHECKPOINT_VERSION = 3
+COMMIT_INTERVAL = 2.0        # seconds between commits while scraping
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS pages (source TEXT PRIMARY KEY, url TEXT NOT NULL, records TEXT NOT NULL,
+                                  digest TEXT, saved REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS pages_url ON pages (url);
+CREATE TABLE IF NOT EXISTS frontiers (crawl TEXT PRIMARY KEY, state TEXT NOT NULL, bloom BLOB NOT NULL);
+"""
+
+
+class CheckpointStore:
+    """SQLite checkpoint of one country's run.
+
+    ``resume=False`` starts from an empty checkpoint; ``resume=True`` keeps
+    what a previous, unfinished run saved. ``finish()`` deletes the file
+    once the run has completed.
+    """
+
+    def __init__(self, path: str, resume: bool = False, commit_interval: float = COMMIT_INTERVAL):
+        self.path = path
+        self.commit_interval = commit_interval
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if not resume:
+            self._remove()
+
+        self.db = sqlite3.connect(path)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(_SCHEMA)
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is not None and int(row[0]) != CHECKPOINT_VERSION:
+            self.db.execute('DROP TABLE pages')
+            self.db.execute('DELETE FROM frontiers')
+            self.db.executescript(_SCHEMA)
+        self.db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(CHECKPOINT_VERSION),))
+        self.db.commit()
+
+        self.resumed_pages = self.db.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+        self._frontiers: Dict[str, Dict] = {}
+        self._last_commit = time.monotonic()
+
+    def _remove(self):
+        for suffix in ('', '-wal', '-shm'):
+            try:
+                os.remove(self.path + suffix)
+            except OSError:
+                pass
+
+    def page(self, source: str) -> Optional[Tuple[List[Dict], Optional[str]]]:
+        """(records, content fingerprint) saved for a finished source, or None if it still has
+        to be scraped"""
+        row = self.db.execute('SELECT records, digest FROM pages WHERE source = ?', (source,)).fetchone()
+        return None if row is None else (json.loads(row[0]), row[1])
+
+    def has_url(self, url: str) -> bool:
+        """Whether some source fetched from ``url`` is already finished"""
+        return self.db.execute('SELECT 1 FROM pages WHERE url = ? LIMIT 1', (url,)).fetchone() is not None
+
+    def save_page(self, source: str, url: str, records: List[Dict], digest: Optional[str] = None):
+        self.db.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)',
+                        (source, url, json.dumps(records, ensure_ascii=False), digest, time.time()))
+        self.maybe_commit()
+
+    def frontier(self, crawl: str) -> Optional[Dict]:
+        """Saved crawler state for a crawl key, as given to save_frontier()"""
+        if crawl in self._frontiers:
+            return self._frontiers[crawl]
+        row = self.db.execute('SELECT state, bloom FROM frontiers WHERE crawl = ?', (crawl,)).fetchone()
+        if row is None:
+            return None
+        state = json.loads(row[0])
+        state['bloom'] = bytes(row[1])
+        return state
+
+    def save_frontier(self, crawl: str, state: Dict):
+        """Remember the latest crawler state; it is written at the next commit"""
+        self._frontiers[crawl] = state
+        self.maybe_commit()
+
+    def maybe_commit(self):
+        if time.monotonic() - self._last_commit >= self.commit_interval:
+            self.commit()
+
+    def commit(self):
+        for crawl, state in self._frontiers.items():
+            data = {key: value for key, value in state.items() if key != 'bloom'}
+            self.db.execute('INSERT OR REPLACE INTO frontiers VALUES (?, ?, ?)',
+                            (crawl, json.dumps(data, ensure_ascii=False), state['bloom']))
+        self._frontiers.clear()
+        self.db.commit()
+        self._last_commit = time.monotonic()
+
+    def close(self):
+        """Commit what is pending and close (the checkpoint stays for --resume)"""
+        if self.db is not None:
+            self.commit()
+            self.db.close()
+            self.db = None
+
+    def finish(self):
+        """The run completed: drop the checkpoint"""
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+        self._remove()
@@ -0,0 +1,63 @@
+"""
+Single-pass USSD code context extraction
+Splits a page into sentences once and locates every code mention with its sentence and
+character offset, so name, description and provider detection share one index
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Pattern, Tuple, Union
+
+# Same sentence delimiters the scrapers have always split on
+SENTENCE_BOUNDARY = re.compile(r'[.!?\n]')
+WHITESPACE = re.compile(r'\s+')
+
+
+class CodeMention(NamedTuple):
+    code: str
+    offset: int
+    sentence_start: int
+    sentence_end: int
+
+
+class CodeContextIndex:
+    """Every code mention in ``text`` (page order) with the sentence around it"""
+
+    def __init__(self, text: str, code_pattern: Union[str, Pattern]):
+        if isinstance(code_pattern, str):
+            code_pattern = re.compile(code_pattern)
+        self.text = text
+        self.boundaries = [match.start() for match in SENTENCE_BOUNDARY.finditer(text)]
+        self.mentions: List[CodeMention] = []
+        self.by_code: Dict[str, List[CodeMention]] = {}
+
+        for match in code_pattern.finditer(text):
+            start, end = self._sentence_span(match.start())
+            mention = CodeMention(match.group(), match.start(), start, end)
+            self.mentions.append(mention)
+            self.by_code.setdefault(mention.code, []).append(mention)
+
+    def _sentence_span(self, offset: int) -> Tuple[int, int]:
+        index = bisect_right(self.boundaries, offset)
+        start = self.boundaries[index - 1] + 1 if index else 0
+        end = self.boundaries[index] if index < len(self.boundaries) else len(self.text)
+        return start, end
+
+    def codes(self) -> List[str]:
+        """Distinct codes in order of first appearance"""
+        return list(self.by_code)
+
+    def offsets(self, code: str) -> List[int]:
+        return [mention.offset for mention in self.by_code.get(code, ())]
+
+    def sentence(self, mention: CodeMention) -> str:
+        return self.text[mention.sentence_start:mention.sentence_end]
+
+    def info(self, code: str) -> Tuple[str, str]:
+        """Name and description for ``code`` taken from the sentence of its first mention"""
+        mentions = self.by_code.get(code)
+        if not mentions:
+            return '', ''
+        name = self.sentence(mentions[0]).replace(code, '').strip()
+        name = WHITESPACE.sub(' ', name)[:100]
+        return name, name
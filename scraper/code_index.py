@@ -0,0 +1,172 @@
+"""
+Code collision and conflict index
+Groups records by normalized code and by code prefix (*920 -> *920*3 -> *920*3*1) once, so
+validation, export and search stages can look codes up in O(1) and tell genuine collisions
+(same code, different providers on the same network) from network-scoped duplicates; the sorted
+code list answers dialed-string (character prefix) queries by binary search
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from near_dup import provider_key
+from record_ids import normalize_code
+
+GENERIC_NETWORKS = {'', 'all', 'all networks'}
+
+CONFLICT = 'conflict'        # different providers claim the code on the same network
+NETWORK_SCOPED = 'network'   # same code, but each provider only on its own network
+_AFTER = '\U0010ffff'        # sorts after any character a code can contain
+
+
+def code_segments(code: str) -> List[str]:
+    """'*920*3#' -> ['*920', '*3', '#']"""
+    segments, current = [], ''
+    for char in normalize_code(code):
+        if char in '*#' and current.strip('*#'):
+            segments.append(current)
+            current = ''
+        current += char
+    if current:
+        segments.append(current)
+    return segments
+
+
+def code_prefixes(code: str) -> List[str]:
+    """Every segment prefix of a code: '*920*3#' -> ['*920', '*920*3', '*920*3#']"""
+    prefixes, current = [], ''
+    for segment in code_segments(code):
+        current += segment
+        prefixes.append(current)
+    return prefixes
+
+
+def networks_overlap(first: str, second: str) -> bool:
+    first, second = first.strip().casefold(), second.strip().casefold()
+    return first == second or first in GENERIC_NETWORKS or second in GENERIC_NETWORKS
+
+
+class Collision(NamedTuple):
+    code: str
+    kind: str                # CONFLICT or NETWORK_SCOPED
+    providers: List[str]
+    records: List[Dict]
+
+
+class CodeIndex:
+    """Lookup tables over a record list (one country, or several with their 'country' set).
+
+    Records are keyed by (country, normalized code); pass ``country`` to
+    queries when the index spans countries.
+    """
+
+    def __init__(self, records: Iterable[Dict], country_name: str = ''):
+        self.country_name = country_name
+        self.by_code: Dict[tuple, List[Dict]] = defaultdict(list)
+        self.by_prefix: Dict[tuple, List[str]] = defaultdict(list)
+        self.collisions: Dict[tuple, Collision] = {}
+
+        for record in records:
+            country = record.get('country', country_name)
+            code = normalize_code(record['code'])
+            if (country, code) not in self.by_code:
+                for prefix in code_prefixes(code):
+                    self.by_prefix[(country, prefix)].append(code)
+            self.by_code[(country, code)].append(record)
+
+        for key, group in self.by_code.items():
+            collision = self._classify(key, group)
+            if collision is not None:
+                self.collisions[key] = collision
+
+        # Distinct codes per country in sorted order, for character-prefix queries
+        self.sorted_codes: Dict[str, List[str]] = defaultdict(list)
+        for country, code in sorted(self.by_code):
+            self.sorted_codes[country].append(code)
+
+    def _classify(self, key: tuple, group: List[Dict]):
+        by_provider: Dict[str, Dict] = {}
+        for record in group:
+            by_provider.setdefault(provider_key(record.get('provider', ''), [key[0]]), record)
+        if len(by_provider) < 2:
+            return None
+
+        distinct = list(by_provider.values())
+        conflict = any(networks_overlap(a.get('network', ''), b.get('network', ''))
+                       for i, a in enumerate(distinct) for b in distinct[i + 1:])
+        return Collision(key[1], CONFLICT if conflict else NETWORK_SCOPED,
+                         [record.get('provider', '') for record in distinct], group)
+
+    def _key(self, code: str, country: str = None) -> tuple:
+        return (self.country_name if country is None else country, normalize_code(code))
+
+    def records_for(self, code: str, country: str = None) -> List[Dict]:
+        """Every record using ``code``"""
+        return self.by_code.get(self._key(code, country), [])
+
+    def providers_for(self, code: str, country: str = None) -> List[str]:
+        return list(dict.fromkeys(record.get('provider', '') for record in self.records_for(code, country)))
+
+    def collision(self, code: str, country: str = None):
+        """The Collision for ``code``, or None if a single provider uses it"""
+        return self.collisions.get(self._key(code, country))
+
+    def codes_under(self, prefix: str, country: str = None) -> List[str]:
+        """Codes sharing a segment prefix, e.g. codes_under('*920') -> ['*920#', '*920*3#', ...]"""
+        return self.by_prefix.get(self._key(prefix, country), [])
+
+    def codes_with_prefix(self, prefix: str, country: str = None) -> List[str]:
+        """Codes starting with what has been dialed so far, e.g. '*920*3' -> ['*920*30#', '*920*31#'], sorted"""
+        country, prefix = self._key(prefix, country)
+        codes = self.sorted_codes.get(country, [])
+        return codes[bisect_left(codes, prefix):bisect_right(codes, prefix + _AFTER)]
+
+    def longest_known_prefix(self, dialed: str, country: str = None) -> str:
+        """Longest prefix of ``dialed`` that some known code starts with.
+
+        The code sharing the longest prefix with ``dialed`` is adjacent to
+        its insertion point, so two comparisons after the binary search do.
+        """
+        country, dialed = self._key(dialed, country)
+        codes = self.sorted_codes.get(country, [])
+        position = bisect_left(codes, dialed)
+        best = 0
+        for neighbour in codes[max(position - 1, 0):position + 1]:
+            length = 0
+            for a, b in zip(dialed, neighbour):
+                if a != b:
+                    break
+                length += 1
+            best = max(best, length)
+        return dialed[:best]
+
+    def longest_matching_code(self, dialed: str, country: str = None) -> Optional[str]:
+        """Longest known code that ``dialed`` starts with (its trailing '#' optional)"""
+        dialed = normalize_code(dialed)
+        for end in range(len(dialed), 0, -1):
+            if end < len(dialed) and dialed[end] not in '*#':
+                continue
+            stem = dialed[:end].rstrip('#')
+            for candidate in (stem + '#', stem):
+                if self.records_for(candidate, country):
+                    return candidate
+        return None
+
+    def conflicts(self) -> List[Collision]:
+        return [collision for collision in self.collisions.values() if collision.kind == CONFLICT]
+
+    def network_scoped(self) -> List[Collision]:
+        return [collision for collision in self.collisions.values() if collision.kind == NETWORK_SCOPED]
+
+    def shared_prefixes(self) -> Dict[tuple, List[str]]:
+        """Service roots (e.g. *920) whose codes belong to more than one provider"""
+        shared = {}
+        for (country, prefix), codes in self.by_prefix.items():
+            if len(code_segments(prefix)) != 1 or len(codes) < 2:
+                continue
+            providers = {provider_key(record.get('provider', ''), [country])
+                         for code in codes for record in self.by_code[(country, code)]}
+            if len(providers) > 1:
+                shared[(country, prefix)] = codes
+        return shared
@@ -0,0 +1,39 @@
+"""
+Code-prefix lookup file for dialed strings
+Serializes the sorted codes of a country's CodeIndex, with the record IDs using each, to a
+small file (prefix/ussd_codes_<country>.prefix.json); load() turns it back into a CodeIndex
+answering exact, prefix ("*920*3" -> *920*30#, *920*31#, ...) and longest-known-prefix queries
+"""
+
+import json
+from typing import Dict
+
+from code_index import CodeIndex
+
+PREFIX_FORMAT = 1
+# Written under the dataset directory but outside the files the app bundles (it has no reader yet)
+PREFIX_DIR_NAME = 'prefix'
+
+
+def to_dict(index: CodeIndex, country: str = None) -> Dict:
+    country = index.country_name if country is None else country
+    codes = index.sorted_codes.get(country, [])
+    ids = [[record.get('id', '') for record in index.records_for(code, country)] for code in codes]
+    return {'format': PREFIX_FORMAT, 'country': country, 'codes': codes, 'ids': ids}
+
+
+def from_dict(data: Dict) -> CodeIndex:
+    if data.get('format') != PREFIX_FORMAT:
+        raise ValueError(f"unsupported prefix index format {data.get('format')!r}")
+    records = [{'id': record_id, 'code': code}
+               for code, ids in zip(data['codes'], data['ids']) for record_id in ids]
+    return CodeIndex(records, data['country'])
+
+
+def dumps(index: CodeIndex, country: str = None) -> bytes:
+    return json.dumps(to_dict(index, country), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load(path: str) -> CodeIndex:
+    with open(path, encoding='utf-8') as f:
+        return from_dict(json.load(f))
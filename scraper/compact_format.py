@@ -0,0 +1,149 @@
+"""
+Compact columnar dataset format (.ussdb)
+Stores a record list column by column; repetitive columns (category, provider, network,
+country, last_updated, ...) are dictionary-encoded as a string table plus fixed-width indexes,
+so every distinct value is stored once and a reader decodes whole columns at a time
+
+Layout (all integers little-endian):
+    b'USDB' | u8 version | u32 rows | u16 columns
+    per column:
+        u16 name length | name (UTF-8)
+        u8 encoding (0 = plain: one table entry per row, 1 = dictionary)
+        u8 index width in bytes (1, 2 or 4; 0 for plain columns)
+        u32 table entries | u32 table length | table: values joined with NUL, UTF-8
+        rows * width bytes of indexes (dictionary columns only); index == len(table)
+        marks a record without this field
+"""
+
+import struct
+import sys
+from array import array
+from typing import Dict, List
+
+from fileio import write_atomic
+
+MAGIC = b'USDB'
+FORMAT_VERSION = 1
+PLAIN, DICTIONARY = 0, 1
+SEPARATOR = '\x00'
+# Written under the dataset directory but outside the files the app bundles (it has no reader yet)
+COMPACT_DIR_NAME = 'compact'
+
+_HEADER = struct.Struct('<4sBIH')
+_COLUMN = struct.Struct('<BBII')
+_INDEX_TYPES = {1: 'B', 2: 'H', 4: 'I'}
+
+
+def _field_order(records: List[Dict]) -> List[str]:
+    fields = {}
+    for record in records:
+        fields.update(dict.fromkeys(record))
+    return list(fields)
+
+
+def _index_width(count: int) -> int:
+    for width in (1, 2, 4):
+        if count < 256 ** width:
+            return width
+    raise ValueError('too many distinct values for one column')
+
+
+def _pack_indexes(indexes: List[int], width: int) -> bytes:
+    values = array(_INDEX_TYPES[width], indexes)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def _encode_column(records: List[Dict], field: str) -> bytes:
+    values = [record.get(field) for record in records]
+    for value in values:
+        if value is not None and (not isinstance(value, str) or SEPARATOR in value):
+            raise ValueError(f"column '{field}' holds {value!r}; only NUL-free strings are supported")
+
+    table = list(dict.fromkeys(value for value in values if value is not None))
+    dict_table = SEPARATOR.join(table).encode('utf-8')
+    width = _index_width(len(table) + 1)
+
+    # Dictionary encoding only where it is smaller than storing every value
+    if None not in values:
+        plain_table = SEPARATOR.join(values).encode('utf-8')
+        if len(plain_table) <= len(dict_table) + width * len(values):
+            return _COLUMN.pack(PLAIN, 0, len(values), len(plain_table)) + plain_table
+
+    positions = {value: index for index, value in enumerate(table)}
+    indexes = [positions[value] if value is not None else len(table) for value in values]
+    return (_COLUMN.pack(DICTIONARY, width, len(table), len(dict_table)) + dict_table
+            + _pack_indexes(indexes, width))
+
+
+def dumps(records: List[Dict]) -> bytes:
+    """Encode a list of flat string records"""
+    fields = _field_order(records)
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(records), len(fields))]
+    for field in fields:
+        name = field.encode('utf-8')
+        parts.append(struct.pack('<H', len(name)) + name)
+        parts.append(_encode_column(records, field))
+    return b''.join(parts)
+
+
+def _split_table(blob: bytes, count: int) -> List[str]:
+    return blob.decode('utf-8').split(SEPARATOR) if count else []
+
+
+def loads(data: bytes) -> List[Dict]:
+    """Decode bytes written by dumps() back into records (field order preserved)"""
+    view = memoryview(data)
+    magic, version, rows, column_count = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError('not a .ussdb file')
+    if version != FORMAT_VERSION:
+        raise ValueError(f'unsupported .ussdb version {version}')
+
+    if not column_count:
+        return [{} for _ in range(rows)]
+
+    offset = _HEADER.size
+    fields, columns, sparse = [], [], []
+    for _ in range(column_count):
+        (name_length,) = struct.unpack_from('<H', view, offset)
+        offset += 2
+        fields.append(bytes(view[offset:offset + name_length]).decode('utf-8'))
+        offset += name_length
+
+        encoding, width, count, table_length = _COLUMN.unpack_from(view, offset)
+        offset += _COLUMN.size
+        table = _split_table(bytes(view[offset:offset + table_length]), count)
+        offset += table_length
+
+        if encoding == PLAIN:
+            columns.append(table)
+            continue
+
+        indexes = array(_INDEX_TYPES[width])
+        indexes.frombytes(view[offset:offset + rows * width])
+        offset += rows * width
+        if sys.byteorder == 'big':
+            indexes.byteswap()
+        if len(table) in indexes:
+            table.append(None)
+            sparse.append(len(fields) - 1)
+        columns.append(list(map(table.__getitem__, indexes)))
+
+    records = [dict(zip(fields, row)) for row in zip(*columns)]
+    for position in sparse:
+        field = fields[position]
+        for record in records:
+            if record[field] is None:
+                del record[field]
+    return records
+
+
+def write(path: str, records: List[Dict]):
+    write_atomic(path, dumps(records))
+
+
+def read(path: str) -> List[Dict]:
+    with open(path, 'rb') as f:
+        return loads(f.read())
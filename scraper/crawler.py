@@ -0,0 +1,212 @@
+"""
+Bounded link-following crawler
+A priority frontier expands the most promising links first (pages that listed USSD codes,
+links mentioning ussd/codes/dial), within per-domain depth and page budgets, and remembers
+seen URLs in a Bloom filter so memory stays flat however many links are discovered
+"""
+
+import hashlib
+import heapq
+import math
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+# Links whose URL or anchor text mention these are expanded first
+RELEVANT_WORDS = ('ussd', 'short code', 'shortcode', 'codes', 'dial', 'mobile money', 'momo',
+                  'mobile banking', 'airtime', 'bundle', 'balance')
+SKIPPED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.pdf', '.zip', '.mp3', '.mp4',
+                      '.css', '.js', '.ico', '.xml', '.doc', '.docx', '.xls', '.xlsx')
+SKIPPED_PATHS = re.compile(r'/(?:tag|tags|author|login|register|wp-admin|wp-json|cart|share)(?:/|$)', re.I)
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set: no false negatives, ~``error_rate`` false positives"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> bool:
+        """Add ``item``; returns False if it was (probably) already present"""
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        self.count += added
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position // 8] & (1 << position % 8) for position in self._positions(item))
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: List[Tuple[str, str]] = []
+        self._href: Optional[str] = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            self._href = dict(attrs).get('href')
+            self._text = []
+
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._href is not None:
+            self.links.append((self._href, ' '.join(''.join(self._text).split())))
+            self._href = None
+
+
+def extract_links(base_url: str, content: bytes) -> List[Tuple[str, str]]:
+    """(absolute url, anchor text) of every http(s) link on a page, fragments removed"""
+    parser = _LinkParser()
+    try:
+        parser.feed(content.decode('utf-8', errors='replace'))
+        parser.close()
+    except Exception:
+        pass  # keep the links found before the markup broke
+    links = []
+    for href, text in parser.links:
+        url = urldefrag(urljoin(base_url, href.strip()))[0]
+        if urlsplit(url).scheme in ('http', 'https'):
+            links.append((url, text))
+    return links
+
+
+def site_of(url: str) -> str:
+    """Host without a leading 'www.', used as the crawl budget key"""
+    host = urlsplit(url).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def link_relevance(url: str, text: str) -> int:
+    """Keyword hits in a link's URL and anchor text"""
+    haystack = f"{url} {text}".lower().replace('-', ' ').replace('_', ' ')
+    return sum(word in haystack for word in RELEVANT_WORDS)
+
+
+def crawlable(url: str) -> bool:
+    path = urlsplit(url).path.lower()
+    return not path.endswith(SKIPPED_EXTENSIONS) and not SKIPPED_PATHS.search(path)
+
+
+def site_links(page_url: str, content: bytes) -> List[Tuple[str, str]]:
+    """Crawlable links of a page to its own site"""
+    site = site_of(page_url)
+    return [(url, text) for url, text in extract_links(page_url, content)
+            if site_of(url) == site and crawlable(url)]
+
+
+class CrawlItem(NamedTuple):
+    url: str
+    depth: int
+    verify_ssl: bool
+    priority: float
+
+
+class Crawler:
+    """Priority frontier with per-site budgets.
+
+    Seeds start at depth 0. After a page is processed, ``add_links`` queues
+    its same-site links with a priority from the number of codes the page
+    yielded and the link's own keywords, minus depth; ``next_batch`` pops the
+    best items while respecting ``max_depth``, ``max_pages_per_site`` and
+    ``max_pages`` overall.
+    """
+
+    def __init__(self, max_depth: int = 2, max_pages_per_site: int = 20, max_pages: int = 200,
+                 seen_capacity: int = 100_000):
+        self.max_depth = max_depth
+        self.max_pages_per_site = max_pages_per_site
+        self.max_pages = max_pages
+        self.seen = BloomFilter(seen_capacity)
+        self.frontier: List[Tuple[float, int, CrawlItem]] = []
+        self.pages_per_site: Dict[str, int] = {}
+        self.fetched = 0
+        self._sequence = 0
+
+    def _push(self, item: CrawlItem):
+        if not self.seen.add(item.url):
+            return
+        heapq.heappush(self.frontier, (-item.priority, self._sequence, item))
+        self._sequence += 1
+
+    def add_seed(self, url: str, verify_ssl: bool = True):
+        self._push(CrawlItem(url, 0, verify_ssl, float('inf')))
+
+    def add_links(self, item: CrawlItem, content: bytes, codes_found: int):
+        """Queue the links of a processed page"""
+        if item.depth >= self.max_depth or not content:
+            return
+        self.queue_links(item, site_links(item.url, content), codes_found)
+
+    def queue_links(self, item: CrawlItem, links: List[Tuple[str, str]], codes_found: int):
+        """Queue already extracted ``site_links`` of a processed page"""
+        if item.depth >= self.max_depth:
+            return
+        page_score = 2 * min(codes_found, 10)
+        for url, text in links:
+            priority = page_score + 3 * link_relevance(url, text) - item.depth
+            self._push(CrawlItem(url, item.depth + 1, item.verify_ssl, priority))
+
+    def next_batch(self, size: int) -> List[CrawlItem]:
+        """Up to ``size`` best items, at most one per site, within the budgets"""
+        batch, deferred, sites = [], [], set()
+        while self.frontier and len(batch) < size and self.fetched < self.max_pages:
+            entry = heapq.heappop(self.frontier)
+            item = entry[2]
+            site = site_of(item.url)
+            if self.pages_per_site.get(site, 0) >= self.max_pages_per_site:
+                continue
+            if site in sites:
+                deferred.append(entry)
+                continue
+            sites.add(site)
+            self.pages_per_site[site] = self.pages_per_site.get(site, 0) + 1
+            self.fetched += 1
+            batch.append(item)
+        for entry in deferred:
+            heapq.heappush(self.frontier, entry)
+        return batch
+
+    def state(self, pending: List[CrawlItem] = ()) -> Dict:
+        """Checkpointable state; ``pending`` are popped batch items not processed yet"""
+        pages_per_site = dict(self.pages_per_site)
+        for item in pending:
+            pages_per_site[site_of(item.url)] -= 1
+        items = [entry[2] for entry in self.frontier] + list(pending)
+        return {
+            'frontier': [list(item) for item in items],
+            'pages_per_site': pages_per_site,
+            'fetched': self.fetched - len(pending),
+            'seen_count': self.seen.count,
+            'bloom': bytes(self.seen.bits),
+        }
+
+    def restore(self, state: Dict):
+        """Continue from a ``state()`` snapshot (pending items are queued again)"""
+        if len(state['bloom']) == len(self.seen.bits):
+            self.seen.bits = bytearray(state['bloom'])
+            self.seen.count = state['seen_count']
+        self.frontier = []
+        for url, depth, verify_ssl, priority in state['frontier']:
+            self.seen.add(url)
+            heapq.heappush(self.frontier, (-priority, self._sequence, CrawlItem(url, depth, verify_ssl, priority)))
+            self._sequence += 1
+        self.pages_per_site = dict(state['pages_per_site'])
+        self.fetched = state['fetched']
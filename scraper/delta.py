@@ -0,0 +1,160 @@
+"""
+Delta export between dataset versions
+Compares a new record set with the previously exported one and writes a compact patch
+(added, removed and changed records keyed by stable ID) plus a per-country version manifest,
+so mirrors and clients can fetch small deltas instead of whole country files
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from fileio import write_atomic
+
+PATCH_FORMAT = 1
+MAX_PATCHES = 20
+PATCH_DIR_NAME = 'patches'
+
+
+def dataset_version(content: bytes) -> str:
+    """Version label of an exported dataset: a prefix of its sha256"""
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def diff_records(old: List[Dict], new: List[Dict]) -> Dict:
+    """added / removed / changed between two record lists keyed by 'id'.
+
+    A changed record lists only the fields it sets (``set``) and the fields
+    it no longer has (``unset``).
+    """
+    old_by_id = {record['id']: record for record in old}
+    new_by_id = {record['id']: record for record in new}
+
+    added = [record for record in new if record['id'] not in old_by_id]
+    removed = [record['id'] for record in old if record['id'] not in new_by_id]
+    changed = []
+    for record in new:
+        before = old_by_id.get(record['id'])
+        if before is None or before == record:
+            continue
+        entry = {'id': record['id'],
+                 'set': {field: value for field, value in record.items() if before.get(field) != value}}
+        unset = [field for field in before if field not in record]
+        if unset:
+            entry['unset'] = unset
+        changed.append(entry)
+
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+def apply_patch(records: List[Dict], patch: Dict) -> List[Dict]:
+    """Reference client: apply a patch to a record list, returning a new list.
+
+    Surviving records keep their order, added records are appended; use the
+    full dataset when order matters.
+    """
+    removed = set(patch['removed'])
+    changes = {change['id']: change for change in patch['changed']}
+    result = []
+    for record in records:
+        if record['id'] in removed:
+            continue
+        change = changes.get(record['id'])
+        if change is not None:
+            record = {field: value for field, value in record.items() if field not in change.get('unset', ())}
+            record.update(change['set'])
+        result.append(dict(record))
+    result.extend(dict(record) for record in patch['added'])
+    return result
+
+
+def _compact(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class DeltaExporter:
+    """Patches and version manifest for one country under ``<dataset_dir>/patches/<slug>/``.
+
+    manifest.json lists every known version (newest last) and the patches
+    between consecutive versions; only the newest ``max_patches`` are kept.
+    The directory sits below assets/dataset, so it is served to mirrors but
+    not bundled into the app.
+    """
+
+    def __init__(self, dataset_dir: str, slug: str, country: str, max_patches: int = MAX_PATCHES):
+        self.directory = os.path.join(dataset_dir, PATCH_DIR_NAME, slug)
+        self.manifest_path = os.path.join(self.directory, 'manifest.json')
+        self.slug = slug
+        self.country = country
+        self.max_patches = max_patches
+
+    def load_manifest(self) -> Dict:
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('format') == PATCH_FORMAT:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {'format': PATCH_FORMAT, 'country': self.country, 'dataset': f'ussd_codes_{self.slug}.json',
+                'latest': None, 'versions': [], 'patches': []}
+
+    def _add_version(self, manifest: Dict, version: str, content: bytes, records: int):
+        if any(entry['version'] == version for entry in manifest['versions']):
+            return
+        manifest['versions'].append({'version': version, 'sha256': hashlib.sha256(content).hexdigest(),
+                                     'size': len(content), 'records': records})
+
+    def export(self, previous: Optional[bytes], current: bytes, records: List[Dict]) -> Optional[Dict]:
+        """Record ``current`` in the manifest and write the patch from ``previous``.
+
+        Returns the manifest entry of the new patch, or None when there was
+        nothing to diff against (first export or unreadable previous file).
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self.load_manifest()
+        to_version = dataset_version(current)
+
+        entry = None
+        old_records = None
+        if previous is not None:
+            try:
+                old_records = json.loads(previous)
+            except ValueError:
+                old_records = None
+
+        if old_records is not None and all('id' in record for record in old_records):
+            from_version = dataset_version(previous)
+            if from_version != to_version:
+                self._add_version(manifest, from_version, previous, len(old_records))
+                patch = {'format': PATCH_FORMAT, 'country': self.country,
+                         'from': from_version, 'to': to_version}
+                patch.update(diff_records(old_records, records))
+                data = _compact(patch)
+                filename = f'{from_version}_{to_version}.json'
+                write_atomic(os.path.join(self.directory, filename), data)
+
+                entry = {'from': from_version, 'to': to_version, 'file': filename, 'size': len(data),
+                         'sha256': hashlib.sha256(data).hexdigest(), 'added': len(patch['added']),
+                         'removed': len(patch['removed']), 'changed': len(patch['changed'])}
+                manifest['patches'] = [p for p in manifest['patches'] if p['file'] != filename] + [entry]
+
+        self._add_version(manifest, to_version, current, len(records))
+        manifest['latest'] = to_version
+        self._prune(manifest)
+        write_atomic(self.manifest_path, json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8'))
+        return entry
+
+    def _prune(self, manifest: Dict):
+        stale, manifest['patches'] = (manifest['patches'][:-self.max_patches],
+                                      manifest['patches'][-self.max_patches:])
+        for patch in stale:
+            try:
+                os.remove(os.path.join(self.directory, patch['file']))
+            except OSError:
+                pass
+        reachable = {manifest['latest']}
+        for patch in manifest['patches']:
+            reachable.update((patch['from'], patch['to']))
+        manifest['versions'] = [entry for entry in manifest['versions'] if entry['version'] in reachable]
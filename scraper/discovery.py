@@ -0,0 +1,149 @@
+"""
+Sitemap and feed discovery
+Streams a site's sitemaps (robots.txt entries, nested sitemap indexes, gzipped sitemaps) and
+RSS/Atom feeds, keeping only page URLs that look like they document USSD codes, so the fetch
+engine spends its requests on product/help pages instead of homepages
+"""
+
+import re
+import xml.etree.ElementTree as ET
+import zlib
+from collections import deque
+from typing import Callable, Iterator, List, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from crawler import site_of
+
+# Page URLs (or feed item titles) worth fetching
+KEYWORD_PATTERN = re.compile(r'ussd|mobile[-_ ]?banking|short[-_ ]?codes?|\bdial(?:ing)?\b', re.I)
+SITEMAP_PATHS = ('/sitemap.xml', '/sitemap_index.xml')
+FEED_PATHS = ('/feed', '/rss.xml', '/feed.xml', '/atom.xml')
+SKIPPED_SITEMAPS = re.compile(r'image|video|author|post_tag|tag-sitemap', re.I)
+CHUNK_SIZE = 64 * 1024
+
+# An entry found while streaming a document: ('sitemap', url, '') for nested sitemaps,
+# ('page', url, title) for pages
+Entry = Tuple[str, ...]
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _chunks(response) -> Iterator[bytes]:
+    """Response body in chunks, gunzipping .xml.gz sitemaps served as raw gzip"""
+    decompressor = None
+    for chunk in response.iter_content(CHUNK_SIZE):
+        if decompressor is None:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if chunk[:2] == b'\x1f\x8b' else False
+        yield decompressor.decompress(chunk) if decompressor else chunk
+
+
+def parse_document(chunks) -> Iterator[Entry]:
+    """Stream a sitemap, sitemap index, RSS or Atom document, yielding its entries.
+
+    Elements are cleared as soon as they are read, so memory does not grow
+    with the document.
+    """
+    parser = ET.XMLPullParser(events=('end',))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            tag = _local(element.tag)
+            if tag in ('sitemap', 'url'):
+                loc = next((child.text for child in element if _local(child.tag) == 'loc'), None)
+                if loc:
+                    yield ('sitemap' if tag == 'sitemap' else 'page', loc.strip(), '')
+                element.clear()
+            elif tag in ('item', 'entry'):
+                link, title = None, ''
+                for child in element:
+                    name = _local(child.tag)
+                    if name == 'link':
+                        link = (child.text or '').strip() or child.get('href')
+                    elif name == 'title':
+                        title = (child.text or '').strip()
+                if link:
+                    yield ('page', link, title)
+                element.clear()
+    parser.close()
+
+
+def robots_sitemaps(text: str, base_url: str) -> List[str]:
+    """Sitemap URLs declared in a robots.txt"""
+    sitemaps = []
+    for line in text.splitlines():
+        key, _, value = line.partition(':')
+        if key.strip().lower() == 'sitemap' and value.strip():
+            sitemaps.append(urljoin(base_url, value.strip()))
+    return sitemaps
+
+
+class SitemapDiscovery:
+    """Find keyword-matching page URLs of a site from its sitemaps and feeds.
+
+    ``get(url)`` must return a streamed response (``stream=True``) or raise.
+    At most ``max_documents`` sitemaps/feeds are read per site and at most
+    ``max_urls`` URLs returned; nested sitemap indexes are followed breadth
+    first.
+    """
+
+    def __init__(self, get: Callable, max_documents: int = 25, max_urls: int = 30,
+                 pattern: re.Pattern = KEYWORD_PATTERN):
+        self.get = get
+        self.max_documents = max_documents
+        self.max_urls = max_urls
+        self.pattern = pattern
+
+    def _open(self, url: str):
+        try:
+            response = self.get(url)
+            if response.status_code != 200:
+                response.close()
+                return None
+            return response
+        except Exception:
+            return None
+
+    def _seed_documents(self, site_url: str) -> List[str]:
+        root = f"{urlsplit(site_url).scheme}://{urlsplit(site_url).netloc}"
+        documents = []
+        response = self._open(root + '/robots.txt')
+        if response is not None:
+            with response:
+                documents.extend(robots_sitemaps(response.text, root))
+        documents.extend(root + path for path in SITEMAP_PATHS + FEED_PATHS)
+        return list(dict.fromkeys(documents))
+
+    def matches(self, url: str, title: str = '') -> bool:
+        return bool(self.pattern.search(urlsplit(url).path) or (title and self.pattern.search(title)))
+
+    def discover(self, site_url: str) -> List[str]:
+        site = site_of(site_url)
+        queue = deque(self._seed_documents(site_url))
+        queued = set(queue)
+        found: List[str] = []
+        documents = 0
+
+        while queue and documents < self.max_documents and len(found) < self.max_urls:
+            response = self._open(queue.popleft())
+            if response is None:
+                continue
+            documents += 1
+            with response:
+                try:
+                    for kind, url, title in parse_document(_chunks(response)):
+                        if site_of(url) != site:
+                            continue
+                        if kind == 'sitemap':
+                            if url not in queued and not SKIPPED_SITEMAPS.search(url):
+                                queued.add(url)
+                                queue.append(url)
+                        elif self.matches(url, title) and url not in found:
+                            found.append(url)
+                            if len(found) >= self.max_urls:
+                                break
+                except (ET.ParseError, zlib.error):
+                    pass  # not XML (e.g. an HTML 404 page served with 200)
+        return found
+
@@ -0,0 +1,50 @@
+"""
+Concurrent fetch engine for the USSD scrapers
+Keeps many hosts in flight at once while staying polite to each individual host
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Sequence, TypeVar
+from urllib.parse import urlsplit
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def host_of(url: str) -> str:
+    """Return the lower-cased host (netloc) of a URL"""
+    return urlsplit(url).netloc.lower()
+
+
+class ConcurrentFetcher:
+    """Run fetch jobs across a thread pool, one worker per host at a time.
+
+    Jobs for the same host are processed sequentially while different hosts
+    run in parallel; pacing within a host is left to the session's rate
+    limiter. Results are returned in the order the jobs were given, so callers
+    get deterministic output regardless of which host answers first.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+
+    def map(self, fetch: Callable[[T], R], jobs: Sequence[T],
+            url_of: Callable[[T], str] = lambda job: job) -> List[R]:
+        """Apply ``fetch`` to every job and return the results in job order"""
+        by_host: Dict[str, List[int]] = {}
+        for index, job in enumerate(jobs):
+            by_host.setdefault(host_of(url_of(job)), []).append(index)
+
+        results: List[R] = [None] * len(jobs)
+
+        def run_host(indexes: List[int]):
+            for index in indexes:
+                results[index] = fetch(jobs[index])
+
+        workers = max(1, min(self.max_workers, len(by_host)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_host, indexes) for indexes in by_host.values()]
+            for future in futures:
+                future.result()
+
+        return results
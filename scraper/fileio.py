@@ -0,0 +1,34 @@
+"""
+Atomic file writes shared by the scraper modules
+Output goes to a temporary file next to the target that then replaces it, so readers (and
+crashed runs) never see a half-written file
+"""
+
+import contextlib
+import os
+
+
+@contextlib.contextmanager
+def atomic_open(path: str, mode: str = 'wb', **kwargs):
+    """Open ``path`` for writing through ``<path>.tmp``, moved into place when the block succeeds"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, mode, **kwargs) as f:
+        yield f
+    os.replace(tmp_path, path)
+
+
+def write_atomic(path: str, data: bytes):
+    with atomic_open(path) as f:
+        f.write(data)
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Write ``data`` unless the file already holds exactly these bytes"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    write_atomic(path, data)
+    return True
@@ -0,0 +1,67 @@
+"""
+Visible-text extraction backends for scraped pages
+The default lxml backend strips script/style/nav/footer and serializes text entirely in C,
+without building BeautifulSoup's Python object tree; html.parser is kept as a fallback
+"""
+
+import threading
+from typing import Callable, Dict
+
+# Elements whose text is never shown to users (or is site chrome)
+SKIPPED_TAGS = ('script', 'style', 'nav', 'footer')
+
+
+def _bs4_visible_text(content: bytes) -> str:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, 'html.parser')
+    for element in soup(list(SKIPPED_TAGS)):
+        element.decompose()
+    return soup.get_text()
+
+
+def _lxml_visible_text(content: bytes) -> str:
+    from lxml import etree, html as lxml_html
+
+    if not content or not content.strip():
+        return ''
+    try:
+        root = lxml_html.document_fromstring(content, parser=_lxml_parser())
+    except etree.ParserError:
+        return ''
+    etree.strip_elements(root, *SKIPPED_TAGS, with_tail=False)
+    return etree.tostring(root, method='text', encoding='unicode')
+
+
+_parsers = threading.local()
+
+
+def _lxml_parser():
+    """One reusable lxml parser per thread (parser objects are not thread-safe)"""
+    parser = getattr(_parsers, 'html', None)
+    if parser is None:
+        from lxml import html as lxml_html
+        parser = _parsers.html = lxml_html.HTMLParser(remove_comments=True, remove_pis=True)
+    return parser
+
+
+PARSER_BACKENDS: Dict[str, Callable[[bytes], str]] = {
+    'lxml': _lxml_visible_text,
+    'html.parser': _bs4_visible_text,
+}
+
+try:
+    import lxml.html  # noqa: F401
+    DEFAULT_BACKEND = 'lxml'
+except ImportError:
+    DEFAULT_BACKEND = 'html.parser'
+
+
+def extract_visible_text(content: bytes, backend: str = DEFAULT_BACKEND) -> str:
+    """Return the user-visible text of an HTML document using the named backend"""
+    try:
+        parse = PARSER_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown parser backend '{backend}', "
+                         f"choose from: {', '.join(PARSER_BACKENDS)}") from None
+    return parse(content)
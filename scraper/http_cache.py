@@ -0,0 +1,129 @@
+"""
+On-disk HTTP conditional-request cache for scraper sessions
+Stores page bodies with their ETag / Last-Modified validators and revalidates them with
+If-None-Match / If-Modified-Since, so unchanged pages cost a 304 instead of a full download
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+import requests
+
+from fileio import write_atomic
+
+
+class HTTPCache:
+    """Directory of ``<sha256(url)>.json`` metadata files and ``.body`` payloads.
+
+    Besides the HTTP validators, the metadata can hold records already
+    extracted from the page (keyed by a caller-chosen parse key), which lets
+    scrapers skip parsing entirely when the server answers 304.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key + suffix)
+
+    def load(self, url: str) -> Optional[Dict]:
+        """Return the cached metadata for ``url``, or None if it is not cached"""
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def body(self, url: str) -> Optional[bytes]:
+        try:
+            with open(self._path(url, '.body'), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for ``url`` based on its cached validators"""
+        meta = self.load(url)
+        headers = {}
+        if meta and os.path.exists(self._path(url, '.body')):
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url: str, response: requests.Response):
+        """Cache a 200 response if the server gave it any validator"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': response.encoding,
+            'records': {},
+        }
+        write_atomic(self._path(url, '.body'), response.content)
+        write_atomic(self._path(url, '.json'), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def load_records(self, url: str, parse_key: str) -> Optional[List[Dict]]:
+        """Records previously extracted from ``url`` under ``parse_key``, if any"""
+        meta = self.load(url)
+        if not meta:
+            return None
+        return meta.get('records', {}).get(parse_key)
+
+    def store_records(self, url: str, parse_key: str, records: List[Dict]):
+        """Remember the records extracted from the currently cached body of ``url``"""
+        meta = self.load(url)
+        if not meta:
+            return
+        meta.setdefault('records', {})[parse_key] = records
+        write_atomic(self._path(url, '.json'), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+
+class CachingSession(requests.Session):
+    """requests.Session that revalidates GETs against an HTTPCache.
+
+    A 304 answer is turned into a 200 response carrying the cached body and
+    ``from_cache = True``; every other response has ``from_cache = False``.
+    Streamed requests (``stream=True``) bypass the cache so their body is
+    never read into memory.
+    """
+
+    def __init__(self, cache: Optional[HTTPCache] = None):
+        super().__init__()
+        self.cache = cache
+
+    def request(self, method, url, headers=None, **kwargs):
+        if self.cache is None or method.upper() != 'GET' or kwargs.get('stream'):
+            response = super().request(method, url, headers=headers, **kwargs)
+            response.from_cache = False
+            return response
+
+        conditional = self.cache.validators(url)
+        if conditional:
+            headers = {**(headers or {}), **conditional}
+
+        response = super().request(method, url, headers=headers, **kwargs)
+        response.from_cache = False
+
+        if response.status_code == 304 and conditional:
+            body = self.cache.body(url)
+            if body is not None:
+                meta = self.cache.load(url) or {}
+                response.status_code = 200
+                response._content = body
+                response.encoding = meta.get('encoding') or response.encoding
+                response.from_cache = True
+        elif response.status_code == 200:
+            self.cache.store(url, response)
+
+        return response
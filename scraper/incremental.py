@@ -0,0 +1,87 @@
+"""
+Incremental scraping state
+Keeps a content hash and the extracted records for every source (scraped URL or catalog
+section) from the previous run, so unchanged sources are reused instead of re-parsed
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from fileio import atomic_open
+
+STATE_VERSION = 1
+
+
+def fingerprint(*parts) -> str:
+    """sha256 over bytes, str or JSON-serializable parts"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        elif not isinstance(part, bytes):
+            part = json.dumps(part, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        digest.update(len(part).to_bytes(8, 'big'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class FingerprintStore:
+    """Per-source fingerprints and records for one country, stored as JSON.
+
+    Sources touched during this run (reused or updated) are written back by
+    ``save()``; sources that were not seen are dropped.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.previous: Dict[str, Dict] = {}
+        self.current: Dict[str, Dict] = {}
+        self.reused = 0
+        self.changed = 0
+
+        try:
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == STATE_VERSION:
+                self.previous = state.get('sources', {})
+        except (OSError, ValueError):
+            pass
+
+    def lookup(self, key: str, digest: str) -> Optional[List[Dict]]:
+        """Previous records for ``key`` if its content hash is unchanged"""
+        entry = self.previous.get(key)
+        if entry is None or entry['hash'] != digest:
+            return None
+        self.current[key] = entry
+        self.reused += 1
+        return [dict(record) for record in entry['records']]
+
+    def last_records(self, key: str) -> Optional[List[Dict]]:
+        """Previous records for ``key`` regardless of hash (e.g. when a fetch failed)"""
+        entry = self.previous.get(key)
+        if entry is None:
+            return None
+        self.current[key] = entry
+        self.reused += 1
+        return [dict(record) for record in entry['records']]
+
+    def update(self, key: str, digest: str, records: List[Dict]):
+        self.current[key] = {'hash': digest, 'records': [dict(record) for record in records]}
+        self.changed += 1
+
+    def restore(self, key: str, digest: str, records: List[Dict]):
+        """Record a source finished before a restart, counted as reused or changed like
+        it was then"""
+        entry = self.previous.get(key)
+        if entry is not None and entry['hash'] == digest:
+            self.current[key] = entry
+            self.reused += 1
+        else:
+            self.update(key, digest, records)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with atomic_open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATE_VERSION, 'sources': self.current}, f, ensure_ascii=False)
@@ -0,0 +1,216 @@
+"""
+Fuzzy near-duplicate detection
+Normalized provider keys ('MTN Ghana' == 'MTN') catch relabelled copies of the same code,
+and MinHash signatures with LSH banding find records with near-identical names/descriptions
+without comparing every pair, within a country's records and across all countries
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from record_ids import normalize_code
+
+NUM_BINS = 64
+BANDS = 16                   # 16 bands x 4 rows: pairs above ~0.5 similarity become candidates
+SHINGLE_SIZE = 4
+SIMILARITY_THRESHOLD = 0.7
+MAX_BUCKET = 50              # larger LSH buckets are boilerplate text, not duplicates
+
+GENERIC_PROVIDERS = {'', 'unknown', 'various', 'various banks', 'all networks', 'all'}
+LEGAL_SUFFIXES = {'plc', 'ltd', 'limited', 'inc', 'llc', 'co', 'company'}
+
+_WORD = re.compile(r'[a-z0-9]+')
+_CODE = re.compile(r'[*#][0-9*#]*')
+_MAX_HASH = 1 << 32
+
+
+def provider_key(provider: str, country_names: Iterable[str] = ()) -> str:
+    """Provider name without case, punctuation, country names or legal suffixes.
+
+    'MTN Ghana', 'MTN' and 'mtn ghana ltd' all map to 'mtn'; 'AirtelTigo'
+    and 'Airtel Tigo' both map to 'airteltigo'.
+    """
+    ignored = set(LEGAL_SUFFIXES)
+    for name in country_names:
+        ignored.update(_WORD.findall(name.casefold()))
+    words = _WORD.findall(provider.casefold())
+    kept = [word for word in words if word not in ignored]
+    return ''.join(kept or words)
+
+
+def is_generic_provider(provider: str, default_provider: str = 'Unknown') -> bool:
+    return provider.strip().casefold() in GENERIC_PROVIDERS | {default_provider.casefold()}
+
+
+def normalized_text(record: Dict) -> str:
+    """Name and description, lowercased, with codes and punctuation removed"""
+    text = f"{record.get('name', '')} {record.get('description', '')}".casefold()
+    return ' '.join(_WORD.findall(_CODE.sub(' ', text)))
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """crc32 hashes of the character n-grams of ``text``"""
+    data = text.encode('utf-8')
+    if len(data) <= size:
+        return {zlib.crc32(data)} if data else set()
+    return {zlib.crc32(data[i:i + size]) for i in range(len(data) - size + 1)}
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def minhash(hashes: Set[int], bins: int = NUM_BINS) -> Optional[Tuple[int, ...]]:
+    """One-permutation MinHash signature: the minimum hash per bin, densified.
+
+    Empty bins borrow the value of the next non-empty bin (with an offset per
+    hop), so short texts still get a full-length signature.
+    """
+    if not hashes:
+        return None
+    signature = [_MAX_HASH] * bins
+    for value in hashes:
+        slot, rank = divmod(value, _MAX_HASH // bins)
+        slot %= bins
+        if rank < signature[slot]:
+            signature[slot] = rank
+    for slot in range(bins):
+        hops = 1
+        while signature[slot] == _MAX_HASH:
+            donor = signature[(slot + hops) % bins]
+            if donor != _MAX_HASH and donor < _MAX_HASH // bins:
+                signature[slot] = donor + hops * (_MAX_HASH // bins)
+            hops += 1
+    return tuple(signature)
+
+
+class LSHIndex:
+    """Buckets signatures by band so only records sharing a band are compared"""
+
+    def __init__(self, bands: int = BANDS, bins: int = NUM_BINS):
+        self.bands = bands
+        self.rows = bins // bands
+        self.buckets: Dict[Tuple, List[int]] = defaultdict(list)
+
+    def add(self, item: int, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            start = band * self.rows
+            self.buckets[(band, signature[start:start + self.rows])].append(item)
+
+    def candidate_pairs(self, max_bucket: int = MAX_BUCKET) -> Set[Tuple[int, int]]:
+        pairs = set()
+        for items in self.buckets.values():
+            if len(items) < 2 or len(items) > max_bucket:
+                continue
+            for i, a in enumerate(items):
+                for b in items[i + 1:]:
+                    pairs.add((a, b) if a < b else (b, a))
+        return pairs
+
+
+def _find(parents: List[int], item: int) -> int:
+    while parents[item] != item:
+        parents[item] = parents[parents[item]]
+        item = parents[item]
+    return item
+
+
+def _field(record: Dict, field: str) -> str:
+    return ' '.join(_WORD.findall(str(record.get(field) or '').casefold()))
+
+
+def same_service(a: Dict, b: Dict, threshold: float = SIMILARITY_THRESHOLD) -> bool:
+    """Whether two records of one code and provider key describe the same service: same
+    network (when both name one) and same category or ``threshold``-similar texts"""
+    network_a, network_b = _field(a, 'network'), _field(b, 'network')
+    if network_a and network_b and network_a != network_b:
+        return False
+    if _field(a, 'category') == _field(b, 'category'):
+        return True
+    return jaccard(shingles(normalized_text(a)), shingles(normalized_text(b))) >= threshold
+
+
+def merge_near_duplicates(records: List[Dict], country_name: str = '', default_provider: str = 'Unknown',
+                          threshold: float = SIMILARITY_THRESHOLD) -> List[Dict]:
+    """Collapse records that describe the same code for the same provider.
+
+    Records are only compared within their normalized code, and there per
+    provider key, so the cost stays near-linear. Records with the same
+    provider key are duplicates if ``same_service`` agrees with the first
+    record of one of the key's groups; a record with a generic provider
+    ('Unknown') also joins a specific provider's group when their texts are
+    at least ``threshold`` similar. Each group keeps the record with a
+    specific provider, preferring catalog records (no 'source') and then
+    original order; the result keeps the original order.
+    """
+    by_code: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+    for index, record in enumerate(records):
+        key = provider_key(record.get('provider', ''), [country_name])
+        by_code[normalize_code(record['code'])][key].append(index)
+
+    parents = list(range(len(records)))
+    generic = [is_generic_provider(record.get('provider', ''), default_provider) for record in records]
+
+    for providers in by_code.values():
+        for members in providers.values():
+            heads = [members[0]]
+            for member in members[1:]:
+                head = next((head for head in heads if same_service(records[head], records[member], threshold)), None)
+                if head is None:
+                    heads.append(member)
+                else:
+                    parents[_find(parents, member)] = _find(parents, head)
+        if len(providers) < 2:
+            continue
+
+        specific = [(members[0], shingles(normalized_text(records[members[0]])))
+                    for members in providers.values() if not generic[members[0]]]
+        for members in providers.values():
+            if not generic[members[0]]:
+                continue
+            for member in members:
+                text = shingles(normalized_text(records[member]))
+                best = max(specific, key=lambda candidate: jaccard(text, candidate[1]), default=None)
+                if best is not None and jaccard(text, best[1]) >= threshold:
+                    parents[_find(parents, member)] = _find(parents, best[0])
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for index in range(len(records)):
+        groups[_find(parents, index)].append(index)
+    keep = {min(members, key=lambda item: (generic[item], 'source' in records[item], item))
+            for members in groups.values()}
+    return [record for index, record in enumerate(records) if index in keep]
+
+
+class NearDuplicate(NamedTuple):
+    similarity: float
+    first: Dict
+    second: Dict
+
+
+def find_near_duplicates(records: List[Dict], threshold: float = SIMILARITY_THRESHOLD) -> List[NearDuplicate]:
+    """Pairs of records (from any countries) whose name and description are near-identical.
+
+    Candidates come from LSH buckets and are confirmed with the exact
+    Jaccard similarity of their shingles; most similar pairs first.
+    """
+    index = LSHIndex()
+    shingle_sets = []
+    for item, record in enumerate(records):
+        hashes = shingles(normalized_text(record))
+        shingle_sets.append(hashes)
+        signature = minhash(hashes)
+        if signature is not None:
+            index.add(item, signature)
+
+    pairs = []
+    for a, b in index.candidate_pairs():
+        similarity = jaccard(shingle_sets[a], shingle_sets[b])
+        if similarity >= threshold:
+            pairs.append(NearDuplicate(similarity, records[a], records[b]))
+    pairs.sort(key=lambda pair: -pair.similarity)
+    return pairs
@@ -0,0 +1,86 @@
+"""
+Precompressed dataset artifacts
+Writes gzip, brotli and zstd copies of the exported files at their maximum compression
+levels plus a manifest of sizes and hashes, so mirrors and the app can pick the smallest
+encoding they support instead of compressing on the fly
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List
+
+from fileio import write_if_changed
+
+MANIFEST_FORMAT = 1
+COMPRESSED_DIR_NAME = 'compressed'
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output byte-identical for identical input
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli(data: bytes) -> bytes:
+    import brotli
+    return brotli.compress(data, mode=brotli.MODE_TEXT, quality=11, lgwin=24)
+
+
+def _zstd(data: bytes) -> bytes:
+    import zstandard
+    return zstandard.ZstdCompressor(level=22).compress(data)
+
+
+# HTTP Content-Encoding token -> (file suffix, compressor, pip package)
+CODECS: Dict[str, tuple] = {
+    'gzip': ('.gz', _gzip, None),
+    'br': ('.br', _brotli, 'brotli'),
+    'zstd': ('.zst', _zstd, 'zstandard'),
+}
+
+
+def available_codecs() -> Dict[str, Callable[[bytes], bytes]]:
+    """Codecs whose library is installed (gzip always is)"""
+    codecs = {}
+    for name, (_, compress, package) in CODECS.items():
+        try:
+            compress(b'')
+        except ImportError:
+            print(f"⚠️ {package} not installed, skipping {name}. Run: pip install {package}")
+            continue
+        codecs[name] = compress
+    return codecs
+
+
+def _describe(data: bytes) -> Dict:
+    return {'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+
+
+def precompress(paths: List[str], directory: str) -> Dict:
+    """Compress each file into ``directory`` and write its manifest.json.
+
+    Every file gets an entry with its own size/sha256 ('identity') and those
+    of each encoding, plus the name of the smallest one.
+    """
+    os.makedirs(directory, exist_ok=True)
+    codecs = available_codecs()
+    files = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        name = os.path.basename(path)
+        source = os.path.relpath(path, directory).replace(os.sep, '/')
+        encodings = {'identity': dict(_describe(data), file=source)}
+        for codec, compress in codecs.items():
+            compressed = compress(data)
+            filename = name + CODECS[codec][0]
+            write_if_changed(os.path.join(directory, filename), compressed)
+            encodings[codec] = dict(_describe(compressed), file=filename)
+        smallest = min(encodings, key=lambda codec: encodings[codec]['size'])
+        files[name] = {'smallest': smallest, 'encodings': encodings}
+
+    manifest = {'format': MANIFEST_FORMAT, 'files': files}
+    write_if_changed(os.path.join(directory, 'manifest.json'),
+                      json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8'))
+    return manifest
@@ -0,0 +1,135 @@
+"""
+Multi-pattern provider detection for scraped pages
+An Aho-Corasick automaton, built once per country from PROVIDER_REGISTRY, finds every
+provider mention in a single pass; codes are attributed to the nearest mention by offset
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Provider names searched for in page text, by country code. Order breaks ties
+# between mentions at the same distance from a code.
+PROVIDER_REGISTRY: Dict[str, List[str]] = {
+    'gh': ['MTN', 'Vodafone', 'AirtelTigo', 'GCB', 'Absa', 'Ecobank',
+           'Fidelity', 'Stanbic', 'Zenith', 'Access', 'CalBank', 'ECG',
+           'NHIS', 'SSNIT', 'Ghana Water', 'DSTV', 'GoTV'],
+}
+
+
+def register_providers(country: str, providers: Iterable[str]):
+    """Add or replace the provider list for a country"""
+    PROVIDER_REGISTRY[country] = list(providers)
+    _MATCHERS.pop(country, None)
+
+
+def _lower_same_length(text: str) -> str:
+    """Lower-case ``text`` without changing any character offsets"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+class ProviderMentions:
+    """Sorted provider mentions on one page, queryable by distance to an offset"""
+
+    def __init__(self, mentions: List[Tuple[int, int, str]]):
+        # (offset, priority, provider), sorted by offset then registry order
+        self.mentions = sorted(mentions)
+        self.offsets = [mention[0] for mention in self.mentions]
+
+    def __len__(self):
+        return len(self.mentions)
+
+    def nearest(self, code_offsets: Iterable[int], code_length: int = 0, window: int = 100) -> str:
+        """Provider mentioned closest to any occurrence of a code (within ``window`` chars).
+
+        Distance is the gap between the mention and the code, so a name just
+        before the code and one just after it are treated alike.
+        """
+        best = None
+        for offset in code_offsets:
+            position = bisect_left(self.offsets, offset - window)
+            while position < len(self.mentions) and self.offsets[position] <= offset + window:
+                mention_offset, priority, provider = self.mentions[position]
+                if mention_offset < offset:
+                    gap = max(0, offset - (mention_offset + len(provider)))
+                else:
+                    gap = max(0, mention_offset - (offset + code_length))
+                candidate = (gap, priority, provider)
+                if best is None or candidate < best:
+                    best = candidate
+                position += 1
+        return best[2] if best else ''
+
+
+class ProviderMatcher:
+    """Aho-Corasick automaton over case-insensitive provider names.
+
+    Matches must sit on word boundaries, so 'Access' does not fire inside
+    'accessible'.
+    """
+
+    def __init__(self, providers: Sequence[str]):
+        self.providers = list(providers)
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        for index, provider in enumerate(self.providers):
+            state = 0
+            for ch in provider.lower():
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(index)
+
+        # Breadth-first failure links
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(ch, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def find_all(self, text: str) -> ProviderMentions:
+        """Every provider mention in ``text`` in one pass"""
+        lowered = _lower_same_length(text)
+        goto, fail, output, providers = self.goto, self.fail, self.output, self.providers
+        length = len(text)
+        mentions = []
+        state = 0
+
+        for position, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in output[state]:
+                start = position - len(providers[index]) + 1
+                end = position + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end < length and text[end].isalnum():
+                    continue
+                mentions.append((start, index, providers[index]))
+
+        return ProviderMentions(mentions)
+
+
+_MATCHERS: Dict[str, ProviderMatcher] = {}
+
+
+def get_provider_matcher(country: str) -> ProviderMatcher:
+    """Compiled matcher for a country's registered providers (built once, then cached)"""
+    matcher = _MATCHERS.get(country)
+    if matcher is None:
+        matcher = _MATCHERS[country] = ProviderMatcher(PROVIDER_REGISTRY[country])
+    return matcher
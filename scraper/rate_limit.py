@@ -0,0 +1,91 @@
+"""
+Per-host rate limiting for scraper sessions
+Token buckets keyed by host, mounted on a requests.Session as a transport adapter
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+
+from fetch_engine import host_of
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests per second with ``burst`` headroom"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns the time spent waiting"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """One token bucket per host, created lazily on first request.
+
+    ``host_limits`` overrides the default (requests_per_second, burst) for
+    specific hosts, e.g. ``{'www.mtn.com.gh': (0.5, 1)}``.
+    """
+
+    def __init__(self, requests_per_second: float = 1.0, burst: int = 1,
+                 host_limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.host_limits = {host.lower(): limit for host, limit in (host_limits or {}).items()}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def bucket_for(self, host: str) -> TokenBucket:
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, (self.requests_per_second, self.burst))
+                bucket = self.buckets[host] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Wait until a request to the host of ``url`` is allowed"""
+        if self.requests_per_second <= 0:
+            return 0.0
+        return self.bucket_for(host_of(url)).acquire()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that waits on a HostRateLimiter before every request it sends"""
+
+    def __init__(self, limiter: HostRateLimiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire(request.url)
+        return super().send(request, **kwargs)
+
+
+def install_rate_limiter(session, limiter: HostRateLimiter, **adapter_kwargs) -> RateLimitedAdapter:
+    """Mount a RateLimitedAdapter on ``session`` for both http and https"""
+    adapter = RateLimitedAdapter(limiter, **adapter_kwargs)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
@@ -0,0 +1,76 @@
+"""
+Stable, content-addressed record IDs
+IDs are derived from (country, code, provider) instead of list position, so inserting or
+removing a record never renumbers the others
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Tuple
+
+ID_HASH_LENGTH = 8
+WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_code(code: str) -> str:
+    """Dialable form of a code: no whitespace"""
+    return WHITESPACE.sub('', code)
+
+
+def normalize_provider(provider: str) -> str:
+    """Case- and spacing-insensitive provider name"""
+    return WHITESPACE.sub(' ', provider).strip().casefold()
+
+
+def identity_key(country: str, record: Dict) -> str:
+    return '\x1f'.join((country.casefold(), normalize_code(record['code']),
+                        normalize_provider(record.get('provider', ''))))
+
+
+def _digest(key: str) -> str:
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def _tiebreak(record: Dict) -> Tuple:
+    return tuple(str(record.get(field, '')) for field in ('name', 'description', 'category', 'network'))
+
+
+def assign_stable_ids(records: List[Dict], prefix: str, country: str) -> List[str]:
+    """Give every record a deterministic ``<prefix>_<hash>`` ID, in place.
+
+    Distinct identities whose short hashes collide get longer hashes until
+    they differ. Records sharing the same identity (same code and provider
+    after normalization) are ordered by their content and suffixed ``-2``,
+    ``-3``..., so the result does not depend on scrape order either.
+    """
+    keys = [identity_key(country, record) for record in records]
+    digests = {key: _digest(key) for key in keys}
+
+    # Shortest hash length (per colliding group) that tells identities apart
+    lengths = {key: ID_HASH_LENGTH for key in digests}
+    pending = set(digests)
+    while pending:
+        groups: Dict[str, List[str]] = {}
+        for key in pending:
+            groups.setdefault(digests[key][:lengths[key]], []).append(key)
+        pending = set()
+        for group in groups.values():
+            if len(group) > 1:
+                for key in group:
+                    lengths[key] += 2
+                pending.update(group)
+
+    by_key: Dict[str, List[int]] = {}
+    for index, key in enumerate(keys):
+        by_key.setdefault(key, []).append(index)
+
+    ids = [''] * len(records)
+    for key, indexes in by_key.items():
+        base = f'{prefix}_{digests[key][:lengths[key]]}'
+        ordered = sorted(indexes, key=lambda index: _tiebreak(records[index]))
+        for position, index in enumerate(ordered):
+            ids[index] = base if position == 0 else f'{base}-{position + 1}'
+
+    for record, record_id in zip(records, ids):
+        record['id'] = record_id
+    return ids
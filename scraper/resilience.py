@@ -0,0 +1,166 @@
+"""
+Retries and per-host circuit breaking for scraper sessions
+Idempotent requests that fail with a network error or a 429/5xx are retried after jittered
+exponential backoff; a host that keeps failing is cut off so its remaining URLs fail at once
+"""
+
+import random
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+from fetch_engine import host_of
+from rate_limit import HostRateLimiter, RateLimitedAdapter
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# A timeout counts as this many breaker failures: the host is likely unresponsive for every URL
+TIMEOUT_WEIGHT = 2
+NAME_RESOLUTION_MESSAGES = ('Name or service not known', 'nodename nor servname', 'getaddrinfo failed',
+                            'Failed to resolve', 'No address associated with hostname')
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+def _causes(error: BaseException):
+    """``error`` and what it wraps (requests -> urllib3 -> socket), each once"""
+    pending, seen = [error], set()
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        pending.extend(cause for cause in (current.__cause__, current.__context__,
+                                           getattr(current, 'reason', None), *current.args)
+                       if isinstance(cause, BaseException))
+
+
+def permanent_failure(error: BaseException) -> bool:
+    """TLS errors and failed DNS lookups, which a retry seconds later will not fix"""
+    if isinstance(error, requests.exceptions.SSLError):
+        return True
+    for cause in _causes(error):
+        if isinstance(cause, socket.gaierror) or type(cause).__name__ == 'NameResolutionError':
+            return True
+        if any(message in str(cause) for message in NAME_RESOLUTION_MESSAGES):
+            return True
+    return False
+
+
+class RetryPolicy:
+    """Up to ``retries`` retries, waiting ``backoff * 2**n`` seconds (capped at
+    ``max_backoff``) before retry n, half of it jittered so workers that failed
+    together do not retry together"""
+
+    def __init__(self, retries: int = 2, backoff: float = 1.0, max_backoff: float = 20.0):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def delay(self, retry: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before retry ``retry`` (0-based), honoring a numeric Retry-After"""
+        retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+        if retry_after.strip().isdigit():
+            return min(float(retry_after), self.max_backoff)
+        ceiling = min(self.max_backoff, self.backoff * 2 ** retry)
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+class CircuitBreaker:
+    """Per-host breaker: ``failure_threshold`` consecutive failures open a host's
+    circuit, and after ``reset_timeout`` seconds one trial request may close it again"""
+
+    def __init__(self, failure_threshold: int = 4, reset_timeout: float = 300.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures: Dict[str, int] = {}
+        self.opened_at: Dict[str, float] = {}
+        self.trial: Dict[str, bool] = {}
+        self.lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """Whether a request to ``host`` may be sent now"""
+        with self.lock:
+            opened_at = self.opened_at.get(host)
+            if opened_at is None:
+                return True
+            if time.monotonic() - opened_at < self.reset_timeout or self.trial.get(host):
+                return False
+            self.trial[host] = True  # half-open: let exactly one request through
+            return True
+
+    def record_success(self, host: str):
+        with self.lock:
+            self.failures.pop(host, None)
+            self.opened_at.pop(host, None)
+            self.trial.pop(host, None)
+
+    def record_failure(self, host: str, weight: int = 1):
+        with self.lock:
+            self.failures[host] = self.failures.get(host, 0) + weight
+            trial = self.trial.pop(host, False)
+            if self.failures[host] >= self.failure_threshold or trial:
+                self.opened_at[host] = time.monotonic()
+
+    def open_hosts(self) -> List[str]:
+        with self.lock:
+            return sorted(self.opened_at)
+
+
+class ResilientAdapter(RateLimitedAdapter):
+    """RateLimitedAdapter that retries idempotent requests and consults a CircuitBreaker.
+
+    Every attempt takes a rate-limit token and counts towards the host's
+    breaker, so a host that times out trips its circuit in the middle of
+    retrying instead of after all of them. TLS and DNS failures are not
+    retried, nor are connect or read timeouts, which also count double. 4xx
+    answers other than 429 count as the host being alive.
+    """
+
+    def __init__(self, limiter: HostRateLimiter, retry: RetryPolicy, breaker: CircuitBreaker, **kwargs):
+        self.retry = retry
+        self.breaker = breaker
+        super().__init__(limiter, **kwargs)
+
+    def send(self, request, **kwargs):
+        host = host_of(request.url)
+        retries = self.retry.retries if request.method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            if not self.breaker.allow(host):
+                raise CircuitOpenError(f"circuit open for {host} after repeated failures", request=request)
+            try:
+                response = super().send(request, **kwargs)
+            except requests.exceptions.Timeout:
+                self.breaker.record_failure(host, TIMEOUT_WEIGHT)
+                raise
+            except requests.exceptions.ConnectionError as e:
+                self.breaker.record_failure(host)
+                if attempt >= retries or permanent_failure(e):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success(host)
+                    return response
+                self.breaker.record_failure(host)
+                if attempt >= retries:
+                    return response
+                time.sleep(self.retry.delay(attempt, response))
+                response.close()
+            attempt += 1
+
+
+def install_resilience(session, limiter: HostRateLimiter, retry: RetryPolicy, breaker: CircuitBreaker,
+                       **adapter_kwargs) -> ResilientAdapter:
+    """Mount a ResilientAdapter on ``session`` for both http and https"""
+    adapter = ResilientAdapter(limiter, retry, breaker, **adapter_kwargs)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
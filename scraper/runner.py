@@ -0,0 +1,143 @@
+"""
+Multi-country parallel runner
+Runs registered country pipelines across a process pool and collects per-country timings, and
+runs queue workers that scrape pages queued by `run --queue` coordinators
+"""
+
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
+from base_scraper import DATASET_DIR, configure_stdout, get_scraper_class
+from work_queue import default_worker_name, open_queue
+
+
+class CountryResult(NamedTuple):
+    country: str
+    country_name: str
+    records: int
+    seconds: float
+    path: str
+    error: str
+    log: str
+
+
+def run_country_job(country: str, output_dir: str = DATASET_DIR, options: Optional[Dict] = None) -> CountryResult:
+    """Run one country's pipeline, capturing its progress output (runs in a worker process)"""
+    configure_stdout()
+    log = io.StringIO()
+    cls = get_scraper_class(country)
+    path = os.path.join(output_dir, f'ussd_codes_{cls.slug}.json')
+    start = time.perf_counter()
+    records, error = 0, ''
+
+    with contextlib.redirect_stdout(log):
+        try:
+            records = len(cls(**(options or {})).run(path))
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+
+    return CountryResult(cls.country_code, cls.country_name, records,
+                         time.perf_counter() - start, path, error, log.getvalue())
+
+
+def run_countries(countries: List[str], jobs: int = None, output_dir: str = DATASET_DIR,
+                  options: Optional[Dict] = None) -> List[CountryResult]:
+    """Run several countries, in parallel processes when jobs > 1; results keep input order"""
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = jobs or min(len(countries), os.cpu_count() or 1)
+
+    if jobs <= 1 or len(countries) <= 1:
+        return [run_country_job(country, output_dir, options) for country in countries]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run_country_job, country, output_dir, options) for country in countries]
+        return [future.result() for future in futures]
+
+
+def retryable(error: Exception) -> bool:
+    """Network errors, 429 and 5xx may go away on a retry; other HTTP errors will not"""
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    return status is None or status == 429 or status >= 500
+
+
+def run_worker(location: str, worker: str = None, batch_size: int = 8, idle_exit: float = 30.0,
+               options: Optional[Dict] = None) -> int:
+    """Lease and scrape queued pages until nothing has been left to do for ``idle_exit`` seconds.
+
+    Each leased batch is fetched concurrently (per host in order, through the
+    scraper's rate limiter) and every page is completed with its records and
+    links, or failed so the queue retries it. Each lease is renewed right
+    before its page is parsed, so a slow batch does not lose the items it has
+    not reached yet; an item whose lease was already taken over is skipped.
+    Returns the pages completed.
+    """
+    queue = open_queue(location)
+    worker = worker or default_worker_name()
+    scrapers = {}
+    completed = 0
+    idle_since = time.monotonic()
+    try:
+        while True:
+            items = queue.lease(worker, batch_size)
+            if not items:
+                if queue.unfinished():
+                    idle_since = time.monotonic()  # retries are scheduled or others hold leases
+                elif time.monotonic() - idle_since >= idle_exit:
+                    break
+                time.sleep(1.0)
+                continue
+
+            by_country: Dict[str, List] = {}
+            for item in items:
+                by_country.setdefault(item.payload['country'], []).append(item)
+            for country, group in by_country.items():
+                if country not in scrapers:
+                    scrapers[country] = get_scraper_class(country)(concurrent=True, **(options or {}))
+                scraper = scrapers[country]
+                scraper.prefetch_sites([(item.payload['url'], item.payload['verify_ssl']) for item in group])
+                for item in group:
+                    if not queue.renew(item):
+                        print(f"  ⏭️ {item.payload['url']}: lease lost to another worker")
+                        scraper.prefetched.pop(item.payload['url'], None)
+                        continue
+                    try:
+                        result = scraper.scrape_work_item(item.payload)
+                    except Exception as e:
+                        print(f"  ❌ {item.payload['url']}: {str(e)[:100]}")
+                        queue.fail(item, f'{type(e).__name__}: {e}', retry=retryable(e))
+                        continue
+                    completed += queue.complete(item, result)
+            idle_since = time.monotonic()
+    finally:
+        queue.close()
+    return completed
+
+
+def run_workers(location: str, processes: int = 1, batch_size: int = 8, idle_exit: float = 30.0,
+                options: Optional[Dict] = None) -> int:
+    """Run ``processes`` queue workers on this machine; returns the pages they completed"""
+    if processes <= 1:
+        return run_worker(location, batch_size=batch_size, idle_exit=idle_exit, options=options)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(run_worker, location, None, batch_size, idle_exit, options)
+                   for _ in range(processes)]
+        return sum(future.result() for future in futures)
+
+
+def print_summary(results: List[CountryResult], wall_seconds: float):
+    """Per-country timing table followed by totals"""
+    print("=" * 50)
+    print(f"{'Country':<16}{'Codes':>7}{'Time':>10}  Status")
+    print("-" * 50)
+    for result in results:
+        status = f"❌ {result.error[:60]}" if result.error else f"✅ {os.path.basename(result.path)}"
+        print(f"{result.country_name:<16}{result.records:>7}{result.seconds:>9.2f}s  {status}")
+    print("-" * 50)
+    total_codes = sum(result.records for result in results)
+    busy = sum(result.seconds for result in results)
+    print(f"{'Total':<16}{total_codes:>7}{wall_seconds:>9.2f}s  (sum of country times {busy:.2f}s)")
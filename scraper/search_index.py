@@ -0,0 +1,151 @@
+"""
+Prebuilt search index for a country dataset
+Built at export time and shipped as ussd_codes_<country>.search.json next to the dataset:
+normalized word tokens and trigram postings over the searchable text and the codes.
+SearchIndex is the reference query engine; it returns exactly what
+USSDDataService.searchUSSDCodes finds by scanning, but answers from index probes, and leaves
+code-prefix (dialing) queries to CodeIndex
+"""
+
+import json
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Set
+
+from app_fields import app_field, display_name, display_provider
+from code_index import CodeIndex
+
+INDEX_FORMAT = 2
+GRAM = 3
+
+_TOKEN = re.compile(r'\w+')
+
+
+def searchable_fields(record: Dict) -> List[str]:
+    """The lowercased fields the app matches a query against (besides the code)"""
+    return [display_name(record).lower(), app_field(record, 'description').lower(),
+            display_provider(record).lower()]
+
+
+def grams(text: str, size: int = GRAM) -> Set[str]:
+    """Every substring of length ``size``; texts shorter than that are their own gram"""
+    if len(text) < size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _postings(pairs: Iterable) -> Dict[str, List[int]]:
+    postings: Dict[str, Set[int]] = {}
+    for key, doc in pairs:
+        postings.setdefault(key, set()).add(doc)
+    return {key: sorted(postings[key]) for key in sorted(postings)}
+
+
+def build_index(records: List[Dict], country: str = '') -> Dict:
+    """The index document for a dataset (records in the order they are exported)"""
+    text_grams, code_grams, tokens = [], [], []
+    for doc, record in enumerate(records):
+        for field in searchable_fields(record):
+            text_grams.extend((gram, doc) for gram in grams(field))
+            tokens.extend((token, doc) for token in _TOKEN.findall(field))
+        code = app_field(record, 'code')
+        code_grams.extend((gram, doc) for gram in grams(code))
+
+    return {
+        'format': INDEX_FORMAT,
+        'country': country,
+        'size': len(records),
+        'ids': [record.get('id', '') for record in records],
+        'tokens': _postings(tokens),
+        'trigrams': _postings(text_grams),
+        'code_trigrams': _postings(code_grams),
+    }
+
+
+def dumps(index: Dict) -> bytes:
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class SearchIndex:
+    """Query engine over a built index and the dataset records it was built from"""
+
+    def __init__(self, index: Dict, records: List[Dict], code_index: CodeIndex = None):
+        if index.get('format') != INDEX_FORMAT:
+            raise ValueError(f"unsupported search index format {index.get('format')!r}")
+        if index['size'] != len(records):
+            raise ValueError('search index does not match the dataset')
+        self.records = records
+        self.tokens = index['tokens']
+        self.trigrams = index['trigrams']
+        self.code_trigrams = index['code_trigrams']
+        self.code_index = code_index or CodeIndex(records, index['country'])
+        self.positions = {id(record): doc for doc, record in enumerate(records)}
+        self.token_list = sorted(self.tokens)
+        self.fields = [searchable_fields(record) for record in records]
+        # 1- and 2-character queries are answered from postings derived at load time
+        self.short_grams = self._short_postings(self.trigrams)
+        self.short_code_grams = self._short_postings(self.code_trigrams)
+
+    @classmethod
+    def load(cls, index_path: str, dataset_path: str) -> 'SearchIndex':
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+        with open(dataset_path, encoding='utf-8') as f:
+            records = json.load(f)
+        return cls(index, records)
+
+    @staticmethod
+    def _short_postings(postings: Dict[str, List[int]]) -> Dict[str, Set[int]]:
+        # Any occurrence of a short query lies inside a gram (or is a whole short field)
+        short: Dict[str, Set[int]] = {}
+        for key, docs in postings.items():
+            for size in range(1, GRAM):
+                for gram in grams(key, size):
+                    short.setdefault(gram, set()).update(docs)
+        return short
+
+    @staticmethod
+    def _substring_docs(query: str, postings: Dict[str, List[int]], short: Dict[str, Set[int]]) -> Set[int]:
+        """Documents whose indexed text may contain ``query`` (exact for short queries)"""
+        if len(query) < GRAM:
+            return short.get(query, set())
+
+        candidates = None
+        for gram in sorted(grams(query), key=lambda gram: len(postings.get(gram, ()))):
+            docs = postings.get(gram)
+            if not docs:
+                return set()
+            candidates = set(docs) if candidates is None else candidates.intersection(docs)
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query: str) -> List[Dict]:
+        """Records matching like searchUSSDCodes: name/description/provider contain the
+        lowercased query, or the code contains the query; dataset order"""
+        if not query:
+            return []
+        lower = query.lower()
+        docs = {doc for doc in self._substring_docs(lower, self.trigrams, self.short_grams)
+                if len(lower) < GRAM or any(lower in field for field in self.fields[doc])}
+        docs.update(doc for doc in self._substring_docs(query, self.code_trigrams, self.short_code_grams)
+                    if len(query) < GRAM or query in app_field(self.records[doc], 'code'))
+        return [self.records[doc] for doc in sorted(docs)]
+
+    def search_words(self, query: str) -> List[Dict]:
+        """Records having, for every word of the query, a word starting with it"""
+        docs = None
+        for word in _TOKEN.findall(query.lower()):
+            matches = set()
+            position = bisect_left(self.token_list, word)
+            while position < len(self.token_list) and self.token_list[position].startswith(word):
+                matches.update(self.tokens[self.token_list[position]])
+                position += 1
+            docs = matches if docs is None else docs & matches
+        return [self.records[doc] for doc in sorted(docs or ())]
+
+    def codes_with_prefix(self, prefix: str) -> List[Dict]:
+        """Records whose code starts with what the user has dialled so far, in dataset order"""
+        docs = [self.positions[id(record)] for code in self.code_index.codes_with_prefix(prefix)
+                for record in self.code_index.records_for(code)]
+        return [self.records[doc] for doc in sorted(docs)]
@@ -0,0 +1,62 @@
+"""
+Pre-sectioned dataset export
+Groups records by category, sorts each section by displayed provider and resolves the display
+fields once at export time, which USSDDataService otherwise redoes on every cold start
+"""
+
+import json
+from typing import Dict, List
+
+from app_fields import app_field, category_info, display_category, display_name, display_provider
+
+SECTIONS_FORMAT = 1
+
+
+def app_code(record: Dict) -> Dict:
+    """A record reduced to the USSDCode fields the app reads"""
+    return {
+        'id': app_field(record, 'id'),
+        'code': app_field(record, 'code'),
+        'name': display_name(record),
+        'description': app_field(record, 'description'),
+        'provider': display_provider(record),
+        'category': category_info(display_category(record))[0],
+    }
+
+
+def build_sections(records: List[Dict]) -> List[Dict]:
+    """USSDSection-shaped dicts in the order the app builds them.
+
+    Sections follow the first appearance of each category; codes within a
+    section are sorted by displayed provider (stable, so ties keep dataset
+    order).
+    """
+    grouped: Dict[str, List[Dict]] = {}
+    for record in records:
+        grouped.setdefault(display_category(record), []).append(app_code(record))
+
+    sections = []
+    for category, codes in grouped.items():
+        _, icon, color, description = category_info(category)
+        codes.sort(key=lambda code: code['provider'])
+        sections.append({
+            'id': category.lower().replace(' ', '_'),
+            'name': category,
+            'description': description,
+            'icon': icon,
+            'color': color,
+            'count': len(codes),
+            'providers': list(dict.fromkeys(code['provider'] for code in codes)),
+            'codes': codes,
+        })
+    return sections
+
+
+def dumps(records: List[Dict], country: str = '') -> bytes:
+    document = {
+        'format': SECTIONS_FORMAT,
+        'country': country,
+        'total': len(records),
+        'sections': build_sections(records),
+    }
+    return json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
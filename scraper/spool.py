@@ -0,0 +1,80 @@
+"""
+Streaming NDJSON record storage
+One JSON record per line, written as records are produced and read back lazily, so large
+crawls can spool raw candidates to disk instead of holding them all in memory
+"""
+
+import json
+import os
+import tempfile
+from typing import Dict, Iterable, Iterator, Optional
+
+from fileio import atomic_open
+
+
+def write_ndjson(path: str, records: Iterable[Dict]) -> int:
+    """Stream records to ``path``, one per line; returns the number written"""
+    count = 0
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def read_ndjson(path: str) -> Iterator[Dict]:
+    """Lazily yield the records of an NDJSON file (blank lines are skipped)"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RecordSpool:
+    """Append-only NDJSON spool usable in place of the ``ussd_codes`` list.
+
+    Supports the list operations the scrapers use while collecting
+    (``append``, ``extend``, ``len``) and can be iterated any number of
+    times; each iteration streams the file from disk.
+    """
+
+    def __init__(self, directory: Optional[str] = None, prefix: str = 'ussd-'):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(prefix=prefix, suffix='.ndjson', dir=directory)
+        self._file = os.fdopen(fd, 'w', encoding='utf-8')
+        self._count = 0
+
+    def append(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write('\n')
+        self._count += 1
+
+    def extend(self, records: Iterable[Dict]):
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Dict]:
+        if not self._file.closed:
+            self._file.flush()
+        return read_ndjson(self.path)
+
+    def close(self, remove: bool = True):
+        """Close the spool file, deleting it unless ``remove`` is False"""
+        if not self._file.closed:
+            self._file.close()
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,67 @@
+import pytest
+
+import base_scraper
+from base_scraper import BaseUSSDScraper
+
+PAGES = {
+    'https://bank.example/ussd': b'<p>Check your balance: dial *124# anytime</p>',
+    'https://telco.example/codes': b'<p>Buy data bundles with *138# today</p>',
+}
+
+
+class FakeResponse:
+    from_cache = False
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+class PagesScraper(BaseUSSDScraper):
+    country_code = 'zz'
+    country_name = 'Testland'
+    slug = 'testland'
+
+    def __init__(self, interrupt_at=None, **options):
+        super().__init__(cache_dir=None, fuzzy_dedup=False, **options)
+        self.interrupt_at = interrupt_at
+        self.fetched = []
+
+    def fetch_page(self, url, verify_ssl=True, timeout=15):
+        if url == self.interrupt_at:
+            raise KeyboardInterrupt
+        self.fetched.append(url)
+        return FakeResponse(PAGES[url])
+
+    def collect(self):
+        for url in PAGES:
+            self.scrape_generic_site(url, 'Banking')
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_scraper, 'STATE_DIR', str(tmp_path))
+
+
+def test_resume_skips_finished_pages():
+    with pytest.raises(KeyboardInterrupt):
+        PagesScraper(interrupt_at='https://telco.example/codes').scrape_all()
+
+    scraper = PagesScraper(resume=True)
+    codes = scraper.scrape_all()
+    assert scraper.fetched == ['https://telco.example/codes']
+    assert sorted(record['code'] for record in codes) == ['*124#', '*138#']
+
+
+def test_interrupt_resume_then_incremental_reuses_every_page():
+    with pytest.raises(KeyboardInterrupt):
+        PagesScraper(interrupt_at='https://telco.example/codes', incremental=True).scrape_all()
+    resumed = PagesScraper(resume=True, incremental=True)
+    resumed.scrape_all()
+    assert resumed.fingerprints.changed == 2
+
+    # Pages from before the restart kept their fingerprints, so nothing is parsed again
+    scraper = PagesScraper(incremental=True)
+    codes = scraper.scrape_all()
+    assert scraper.fingerprints.reused == 2
+    assert scraper.fingerprints.changed == 0
+    assert sorted(record['code'] for record in codes) == ['*124#', '*138#']
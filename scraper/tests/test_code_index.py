@@ -0,0 +1,40 @@
+import glob
+import json
+import os
+
+import pytest
+
+from base_scraper import DATASET_DIR
+from code_index import CodeIndex
+from record_ids import assign_stable_ids
+
+DATASETS = sorted(glob.glob(os.path.join(DATASET_DIR, 'ussd_codes_*.json')))
+
+
+@pytest.mark.parametrize('path', DATASETS, ids=os.path.basename)
+def test_prefix_queries_match_linear_scans(path):
+    with open(path, encoding='utf-8') as f:
+        records = json.load(f)
+    index = CodeIndex(records, records[0]['country'])
+    codes = sorted({record['code'] for record in records})
+    for dialed in {code[:size] for code in codes for size in range(1, len(code) + 1)} | {'*9999*1#', '#'}:
+        assert index.codes_with_prefix(dialed) == [code for code in codes if code.startswith(dialed)], dialed
+        longest = max((os.path.commonprefix([dialed, code]) for code in codes), key=len)
+        assert index.longest_known_prefix(dialed) == longest, dialed
+
+
+def test_longest_matching_code_stops_at_a_separator():
+    index = CodeIndex([{'id': '1', 'code': '*920#'}, {'id': '2', 'code': '*920*3#'}], 'Ghana')
+    assert index.longest_matching_code('*920*31#') == '*920#'
+    assert index.longest_matching_code('*920*3') == '*920*3#'
+    assert index.longest_matching_code('*92') is None
+
+
+def test_ids_do_not_depend_on_record_order():
+    records = [{'code': '*170#', 'provider': 'MTN', 'name': 'Mobile Money'},
+               {'code': '*170#', 'provider': 'mtn ', 'name': 'MoMo'},
+               {'code': '*110#', 'provider': 'Telecel', 'name': 'Telecel Cash'}]
+    ids = assign_stable_ids([dict(record) for record in records], 'gh', 'Ghana')
+    reversed_ids = assign_stable_ids([dict(record) for record in reversed(records)], 'gh', 'Ghana')
+    assert ids == list(reversed(reversed_ids))
+    assert len(set(ids)) == 3
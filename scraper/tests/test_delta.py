@@ -0,0 +1,44 @@
+import json
+import os
+
+from delta import DeltaExporter, apply_patch, dataset_version
+
+
+def dump(records):
+    return json.dumps(records, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+OLD = [
+    {'id': 'gh_1', 'code': '*170#', 'name': 'MTN Mobile Money', 'provider': 'MTN', 'network': 'MTN'},
+    {'id': 'gh_2', 'code': '*110#', 'name': 'Telecel Cash', 'provider': 'Telecel', 'note': 'old menu'},
+    {'id': 'gh_3', 'code': '*920#', 'name': 'Absa', 'provider': 'Absa Bank Ghana'},
+]
+NEW = [
+    {'id': 'gh_1', 'code': '*170#', 'name': 'MTN MoMo', 'provider': 'MTN', 'network': 'MTN'},
+    {'id': 'gh_2', 'code': '*110#', 'name': 'Telecel Cash', 'provider': 'Telecel'},
+    {'id': 'gh_4', 'code': '*422#', 'name': 'Ecobank', 'provider': 'Ecobank'},
+]
+
+
+def test_exported_patch_turns_the_previous_dataset_into_the_new_one(tmp_path):
+    exporter = DeltaExporter(str(tmp_path), 'ghana', 'Ghana')
+    entry = exporter.export(dump(OLD), dump(NEW), NEW)
+    assert (entry['added'], entry['removed'], entry['changed']) == (1, 1, 2)
+
+    with open(os.path.join(exporter.directory, entry['file']), encoding='utf-8') as f:
+        patch = json.load(f)
+    assert (patch['from'], patch['to']) == (dataset_version(dump(OLD)), dataset_version(dump(NEW)))
+    patched = apply_patch(OLD, patch)
+    assert sorted(patched, key=lambda record: record['id']) == sorted(NEW, key=lambda record: record['id'])
+    assert OLD[1]['note'] == 'old menu'  # the input list is left alone
+
+
+def test_manifest_chains_versions(tmp_path):
+    exporter = DeltaExporter(str(tmp_path), 'ghana', 'Ghana')
+    assert exporter.export(None, dump(OLD), OLD) is None
+    exporter.export(dump(OLD), dump(NEW), NEW)
+    manifest = exporter.load_manifest()
+    assert manifest['latest'] == dataset_version(dump(NEW))
+    assert [version['version'] for version in manifest['versions']] == [dataset_version(dump(OLD)),
+                                                                       dataset_version(dump(NEW))]
+    assert len(manifest['patches']) == 1
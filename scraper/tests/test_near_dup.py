@@ -0,0 +1,29 @@
+from near_dup import merge_near_duplicates
+
+
+def record(provider, network='MTN', category='Mobile Money', name='Mobile Money menu',
+           description='Send money, pay bills and buy airtime', **fields):
+    return dict(code='*170#', provider=provider, network=network, category=category, name=name,
+                description=description, **fields)
+
+
+def test_relabelled_provider_copies_are_merged():
+    records = [record('MTN Ghana'), record('MTN', source='https://example.com')]
+    assert merge_near_duplicates(records, 'Ghana') == [records[0]]
+
+
+def test_same_provider_key_on_another_network_is_kept():
+    records = [record('MTN Ghana'), record('MTN', network='Vodafone')]
+    assert merge_near_duplicates(records, 'Ghana') == records
+
+
+def test_same_provider_key_for_a_different_service_is_kept():
+    records = [record('MTN Ghana'),
+               record('MTN', category='Telecom', name='Data bundles',
+                      description='Buy daily, weekly and monthly internet bundles')]
+    assert merge_near_duplicates(records, 'Ghana') == records
+
+
+def test_generic_provider_copy_joins_the_matching_provider():
+    records = [record('MTN Ghana'), record('Unknown', category='Various', source='https://example.com')]
+    assert merge_near_duplicates(records, 'Ghana') == [records[0]]
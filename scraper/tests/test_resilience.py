@@ -0,0 +1,77 @@
+import socket
+
+import pytest
+import requests
+
+import resilience
+from rate_limit import HostRateLimiter, RateLimitedAdapter
+from resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, install_resilience
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Session whose every request fails with ``session.error``; ``session.sent`` counts the attempts"""
+    session = requests.Session()
+    session.sent = 0
+
+    def send(adapter, request, **kwargs):
+        session.sent += 1
+        raise session.error
+
+    monkeypatch.setattr(RateLimitedAdapter, 'send', send)
+    monkeypatch.setattr(resilience.time, 'sleep', lambda seconds: None)
+    session.breaker = CircuitBreaker(failure_threshold=4)
+    install_resilience(session, HostRateLimiter(1000, 100), RetryPolicy(retries=2), session.breaker)
+    return session
+
+
+def test_network_errors_are_retried(session):
+    session.error = requests.exceptions.ConnectionError('connection reset')
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get('https://bank.example/ussd')
+    assert session.sent == 3
+
+
+@pytest.mark.parametrize('error', [
+    requests.exceptions.SSLError('certificate verify failed'),
+    requests.exceptions.ConnectionError(socket.gaierror(-2, 'Name or service not known')),
+])
+def test_tls_and_dns_failures_are_not_retried(session, error):
+    session.error = error
+    with pytest.raises(type(error)):
+        session.get('https://bank.example/ussd')
+    assert session.sent == 1
+    assert session.breaker.failures == {'bank.example': 1}
+
+
+@pytest.mark.parametrize('error', [requests.exceptions.ConnectTimeout('connect timed out'),
+                                   requests.exceptions.ReadTimeout('read timed out')])
+def test_timeouts_trip_the_circuit_after_two_pages(session, error):
+    session.error = error
+    for page in ('a', 'b'):
+        with pytest.raises(type(error)):
+            session.get(f'https://bank.example/{page}')
+    with pytest.raises(CircuitOpenError):
+        session.get('https://bank.example/c')
+    assert session.sent == 2
+
+
+def test_failed_trial_reopens_the_circuit_until_the_next_trial(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(resilience.time, 'monotonic', lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    for _ in range(2):
+        assert breaker.allow('bank.example')
+        breaker.record_failure('bank.example')
+    assert not breaker.allow('bank.example')
+
+    now[0] = 11.0
+    assert breaker.allow('bank.example')        # half-open: one trial
+    assert not breaker.allow('bank.example')
+    breaker.record_failure('bank.example')      # the trial failed
+    assert not breaker.allow('bank.example')
+
+    now[0] = 22.0
+    assert breaker.allow('bank.example')        # half-open again
+    breaker.record_success('bank.example')
+    assert breaker.allow('bank.example') and breaker.allow('bank.example')
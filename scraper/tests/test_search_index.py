@@ -0,0 +1,64 @@
+import glob
+import json
+import os
+
+import pytest
+
+import search_index
+from base_scraper import DATASET_DIR
+from search_index import SearchIndex
+
+
+def dart_search(query, records):
+    """USSDDataService: fields read with `??` (null-only fallbacks), then searchUSSDCodes' scan"""
+    if not query:
+        return []
+    results = []
+    for record in records:
+        network, provider = record.get('network'), record.get('provider')
+        shown_provider = (network if network is not None else provider if provider is not None else 'Unknown')
+        shown_provider = shown_provider.replace(' Ghana', '').replace('Ghana', '').strip()
+        name = record.get('name') if record.get('name') is not None else 'Unknown'
+        description = record.get('description') if record.get('description') is not None else ''
+        code = record.get('code') if record.get('code') is not None else ''
+        lower = query.lower()
+        if (lower in name.lower() or lower in description.lower() or lower in shown_provider.lower()
+                or query in code):
+            results.append(record)
+    return results
+
+
+RECORDS = [
+    {'id': 'a', 'code': '*170#', 'name': 'MTN Mobile Money', 'description': 'Send money',
+     'provider': 'MTN Ghana', 'network': 'MTN Ghana'},
+    {'id': 'b', 'code': '*110#', 'name': 'Data bundles', 'description': '', 'provider': 'Telecel',
+     'network': ''},
+    {'id': 'c', 'code': '*920#', 'name': '', 'description': None, 'provider': '', 'network': None},
+    {'id': 'd', 'code': '*126#', 'name': None, 'description': 'Unknown caller check', 'provider': 'Various'},
+]
+
+
+def test_search_matches_the_app_with_empty_and_null_fields():
+    index = SearchIndex(search_index.build_index(RECORDS), RECORDS)
+    for query in ('unknown', 'Unk', 'telecel', 'mtn', 'money', '*1', '#', '', 'u', 'data', 'various', 'gh'):
+        assert index.search(query) == dart_search(query, RECORDS), query
+
+
+def typed_queries(records):
+    """What a user types on the way to each word and code of the dataset"""
+    queries = set()
+    for record in records:
+        for word in f"{record['name']} {record['description']} {record['provider']}".split():
+            queries.update(word[:size] for size in range(1, min(len(word), 6) + 1))
+        queries.update(record['code'][:size] for size in range(1, len(record['code']) + 1))
+    return sorted(queries)
+
+
+@pytest.mark.parametrize('path', sorted(glob.glob(os.path.join(DATASET_DIR, 'ussd_codes_*.json'))),
+                         ids=os.path.basename)
+def test_search_matches_a_linear_scan_on_the_shipped_datasets(path):
+    with open(path, encoding='utf-8') as f:
+        records = json.load(f)
+    index = SearchIndex(search_index.build_index(records), records)
+    for query in typed_queries(records):
+        assert index.search(query) == dart_search(query, records), query
@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+import base_scraper
+from base_scraper import BaseUSSDScraper
+from runner import run_worker
+from work_queue import SQLiteWorkQueue, WorkQueue
+
+PAGES = {}
+
+
+class FakeResponse:
+    from_cache = False
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+class QueueScraper(BaseUSSDScraper):
+    country_code = 'zq'
+    country_name = 'Queueland'
+    slug = 'queueland'
+
+    def __init__(self, **options):
+        super().__init__(cache_dir=None, fuzzy_dedup=False, **options)
+
+    def fetch_page(self, url, verify_ssl=True, timeout=15):
+        return FakeResponse(PAGES[url])
+
+    def collect(self):
+        for url in sorted(PAGES):
+            self.scrape_generic_site(url, 'Banking')
+
+
+@pytest.fixture
+def queue_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(base_scraper, 'STATE_DIR', str(tmp_path))
+    monkeypatch.setitem(base_scraper.COUNTRY_REGISTRY, QueueScraper.country_code, QueueScraper)
+    return str(tmp_path / 'queue.sqlite')
+
+
+def scrape_with_worker(queue_path):
+    worker = threading.Thread(target=run_worker, args=(queue_path,), kwargs={'idle_exit': 3.0}, daemon=True)
+    worker.start()
+    codes = QueueScraper(work_queue=queue_path, queue_timeout=30).scrape_all()
+    worker.join()
+    return sorted(record['code'] for record in codes)
+
+
+def test_every_queue_run_scrapes_pages_again(queue_path):
+    PAGES.update({'https://bank.example/ussd': b'<p>Check your balance: dial *124# anytime</p>',
+                  'https://telco.example/codes': b'<p>Buy data bundles with *138# today</p>'})
+    assert scrape_with_worker(queue_path) == ['*124#', '*138#']
+
+    PAGES['https://bank.example/ussd'] = b'<p>Check your balance: dial *125# anytime</p>'
+    assert scrape_with_worker(queue_path) == ['*125#', '*138#']
+    # Only the second run's items are left
+    assert sum(SQLiteWorkQueue(queue_path).counts().values()) == 2
+
+
+def test_wait_for_fails_without_workers(tmp_path):
+    queue = SQLiteWorkQueue(str(tmp_path / 'queue.sqlite'))
+    queue.put('zq page', {})
+    with pytest.raises(TimeoutError, match='start workers'):
+        queue.wait_for(['zq page'], poll_interval=0.01, timeout=0.05)
+
+
+def test_worker_skips_items_whose_lease_was_taken_over(tmp_path):
+    queue = SQLiteWorkQueue(str(tmp_path / 'queue.sqlite'), lease_seconds=0)
+    queue.put('zq page', {})
+    [stale] = queue.lease('slow worker')
+    [current] = queue.lease('other worker')
+    assert not queue.renew(stale)
+    assert queue.renew(current)
+
+
+def test_wait_for_treats_discarded_items_as_finished(tmp_path):
+    queue = SQLiteWorkQueue(str(tmp_path / 'queue.sqlite'))
+    queue.put('zq run1 page', {})
+    queue.discard('zq ')
+    queue.wait_for(['zq run1 page'], poll_interval=0.01, timeout=1)
+
+
+def test_backends_must_implement_the_whole_interface():
+    class PartialQueue(WorkQueue):
+        def put(self, key, payload):
+            return True
+
+    with pytest.raises(TypeError):
+        PartialQueue()
@@ -0,0 +1,280 @@
+"""
+Work queue for distributed scraping
+Page scrapes are queued as work items that workers lease, retry on failure and complete with
+their records; WorkQueue is the interface, SQLiteWorkQueue the local/offline backend
+"""
+
+import abc
+import contextlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+LEASE_SECONDS = 120.0        # a worker that stops renewing loses its items after this
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 5.0            # first retry delay, doubled on every further attempt
+
+# Item states
+PENDING, LEASED, DONE, FAILED = 'pending', 'leased', 'done', 'failed'
+
+
+class WorkItem(NamedTuple):
+    key: str                 # unique per unit of work, so re-queueing is idempotent
+    payload: Dict
+    attempts: int            # including the current lease
+    lease: str               # token of the current lease; complete()/fail() must present it
+
+
+class ItemStatus(NamedTuple):
+    state: str
+    attempts: int
+    result: Optional[Dict]
+    error: str
+
+
+class WorkQueue(abc.ABC):
+    """What a queue backend provides.
+
+    Items are leased for ``lease_seconds``; a lease that is neither completed,
+    failed nor renewed in time expires and the item is handed out again, up
+    to ``max_attempts`` leases in total. Only the current lease holder can
+    complete or fail an item, so a worker that stalled past its lease cannot
+    overwrite the result of the worker that took over.
+    """
+
+    @abc.abstractmethod
+    def put(self, key: str, payload: Dict) -> bool:
+        """Queue an item; False if ``key`` was already queued (whatever its state)"""
+
+    @abc.abstractmethod
+    def lease(self, worker: str, count: int = 1) -> List[WorkItem]:
+        """Lease up to ``count`` available items, oldest first"""
+
+    @abc.abstractmethod
+    def renew(self, item: WorkItem) -> bool:
+        """Extend a lease; False if it was lost"""
+
+    @abc.abstractmethod
+    def complete(self, item: WorkItem, result: Dict) -> bool:
+        """Store the result of a leased item; False if the lease was lost"""
+
+    @abc.abstractmethod
+    def fail(self, item: WorkItem, error: str, retry: bool = True) -> bool:
+        """Give the item back for a later retry, or mark it failed after its last attempt
+        (or right away with ``retry=False``)"""
+
+    @abc.abstractmethod
+    def status(self, key: str) -> Optional[ItemStatus]:
+        """State of an item, or None if ``key`` is not queued"""
+
+    @abc.abstractmethod
+    def results(self) -> Iterator[Tuple[str, Dict]]:
+        """(key, result) of every completed item"""
+
+    @abc.abstractmethod
+    def counts(self) -> Dict[str, int]:
+        """Number of items per state"""
+
+    @abc.abstractmethod
+    def discard(self, prefix: str) -> int:
+        """Drop every item whose key starts with ``prefix``; returns how many were dropped"""
+
+    def unfinished(self) -> int:
+        """Items still pending (including scheduled retries) or leased"""
+        counts = self.counts()
+        return counts[PENDING] + counts[LEASED]
+
+    def close(self):
+        pass
+
+    def wait_for(self, keys: Iterable[str], poll_interval: float = 2.0, timeout: Optional[float] = None):
+        """Block until none of ``keys`` is pending or leased any more.
+
+        Raises TimeoutError when none of them has finished for ``timeout``
+        seconds, which usually means no worker is running.
+        """
+        waiting = list(keys)
+        progress = time.monotonic()
+        while waiting:
+            # A key discarded in the meantime (status None) counts as finished
+            statuses = [(key, self.status(key)) for key in waiting]
+            still_waiting = [key for key, status in statuses
+                             if status is not None and status.state in (PENDING, LEASED)]
+            if len(still_waiting) < len(waiting):
+                progress = time.monotonic()
+            waiting = still_waiting
+            if not waiting:
+                break
+            if timeout is not None and time.monotonic() - progress >= timeout:
+                raise TimeoutError(f"{len(waiting)} queued items did not finish for {timeout:.0f}s; "
+                                   f"start workers with: python -m scraper work --queue <location>")
+            time.sleep(poll_interval)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease TEXT,
+    worker TEXT,
+    result TEXT,
+    error TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS items_available ON items (state, available_at);
+"""
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """WorkQueue in a SQLite file, shared by any number of worker processes.
+
+    Leasing is one short write transaction per batch, so workers spend their
+    time fetching, not waiting on the database. Several machines can share
+    the file only through a filesystem with working locks; otherwise put a
+    networked backend behind the same interface.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = LEASE_SECONDS,
+                 max_attempts: int = MAX_ATTEMPTS, retry_delay: float = RETRY_DELAY):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        self._sequence = 0
+        self.db.executescript(_SCHEMA)
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """One connection per thread"""
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = self._local.db = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Write transaction, taking the database lock up front"""
+        db = self.db
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            yield db
+        except BaseException:
+            db.execute('ROLLBACK')
+            raise
+        db.execute('COMMIT')
+
+    def put(self, key: str, payload: Dict) -> bool:
+        cursor = self.db.execute('INSERT OR IGNORE INTO items (key, payload, state, available_at) VALUES (?, ?, ?, ?)',
+                                 (key, json.dumps(payload, ensure_ascii=False), PENDING, time.time()))
+        return cursor.rowcount == 1
+
+    def put_many(self, items: Iterable[Tuple[str, Dict]]) -> int:
+        """Queue many (key, payload) items in one transaction; returns how many were new"""
+        now = time.time()
+        with self._transaction() as db:
+            before = db.total_changes
+            db.executemany('INSERT OR IGNORE INTO items (key, payload, state, available_at) VALUES (?, ?, ?, ?)',
+                           ((key, json.dumps(payload, ensure_ascii=False), PENDING, now) for key, payload in items))
+            return db.total_changes - before
+
+    def _new_lease(self, worker: str) -> str:
+        self._sequence += 1
+        return f'{worker}:{time.time():.6f}:{self._sequence}'
+
+    def lease(self, worker: str, count: int = 1) -> List[WorkItem]:
+        now = time.time()
+        with self._transaction() as db:
+            # Expired leases of items without attempts left fail here, the rest become available
+            db.execute('UPDATE items SET state = ?, error = ? WHERE state = ? AND available_at <= ? AND attempts >= ?',
+                       (FAILED, 'lease expired', LEASED, now, self.max_attempts))
+            rows = db.execute('SELECT key, payload, attempts FROM items '
+                              'WHERE state IN (?, ?) AND available_at <= ? ORDER BY available_at, rowid LIMIT ?',
+                              (PENDING, LEASED, now, count)).fetchall()
+            items = []
+            for key, payload, attempts in rows:
+                lease = self._new_lease(worker)
+                db.execute('UPDATE items SET state = ?, attempts = ?, available_at = ?, lease = ?, worker = ? '
+                           'WHERE key = ?', (LEASED, attempts + 1, now + self.lease_seconds, lease, worker, key))
+                items.append(WorkItem(key, json.loads(payload), attempts + 1, lease))
+        return items
+
+    def renew(self, item: WorkItem) -> bool:
+        cursor = self.db.execute('UPDATE items SET available_at = ? WHERE key = ? AND state = ? AND lease = ?',
+                                 (time.time() + self.lease_seconds, item.key, LEASED, item.lease))
+        return cursor.rowcount == 1
+
+    def complete(self, item: WorkItem, result: Dict) -> bool:
+        cursor = self.db.execute('UPDATE items SET state = ?, result = ?, error = ? '
+                                 'WHERE key = ? AND state = ? AND lease = ?',
+                                 (DONE, json.dumps(result, ensure_ascii=False), '', item.key, LEASED, item.lease))
+        return cursor.rowcount == 1
+
+    def fail(self, item: WorkItem, error: str, retry: bool = True) -> bool:
+        if not retry or item.attempts >= self.max_attempts:
+            state, available_at = FAILED, time.time()
+        else:
+            state, available_at = PENDING, time.time() + self.retry_delay * 2 ** (item.attempts - 1)
+        cursor = self.db.execute('UPDATE items SET state = ?, available_at = ?, error = ? '
+                                 'WHERE key = ? AND state = ? AND lease = ?',
+                                 (state, available_at, error[:500], item.key, LEASED, item.lease))
+        return cursor.rowcount == 1
+
+    def status(self, key: str) -> Optional[ItemStatus]:
+        row = self.db.execute('SELECT state, attempts, result, error, available_at FROM items WHERE key = ?',
+                              (key,)).fetchone()
+        if row is None:
+            return None
+        state, attempts, result, error, available_at = row
+        if state == LEASED and available_at <= time.time() and attempts >= self.max_attempts:
+            state = FAILED  # expired for good, even if no worker has leased since
+        return ItemStatus(state, attempts, json.loads(result) if result else None, error)
+
+    def results(self) -> Iterator[Tuple[str, Dict]]:
+        for key, result in self.db.execute('SELECT key, result FROM items WHERE state = ? ORDER BY rowid', (DONE,)):
+            yield key, json.loads(result)
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys((PENDING, LEASED, DONE, FAILED), 0)
+        counts.update(self.db.execute('SELECT state, COUNT(*) FROM items GROUP BY state'))
+        return counts
+
+    def discard(self, prefix: str) -> int:
+        cursor = self.db.execute('DELETE FROM items WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+        return cursor.rowcount
+
+    def close(self):
+        db = getattr(self._local, 'db', None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+
+# URL scheme -> backend; a networked broker registers here and is chosen with its own scheme
+QUEUE_BACKENDS: Dict[str, Type[WorkQueue]] = {'sqlite': SQLiteWorkQueue}
+
+
+def open_queue(location: str, **options) -> WorkQueue:
+    """Open a queue by location: a file path or sqlite:///path, or <scheme>://... of a registered backend"""
+    scheme, separator, rest = location.partition('://')
+    if not separator:
+        return SQLiteWorkQueue(location, **options)
+    if scheme not in QUEUE_BACKENDS:
+        raise ValueError(f"No work queue backend for '{scheme}://', choose from: {', '.join(QUEUE_BACKENDS)}")
+    if scheme == 'sqlite':
+        # sqlite:///relative/path, sqlite:////absolute/path
+        return SQLiteWorkQueue(rest[1:] if rest.startswith('/') else rest, **options)
+    return QUEUE_BACKENDS[scheme](location, **options)
+
+
+def default_worker_name() -> str:
+    return f'{socket.gethostname()}:{os.getpid()}'